@@ -2,16 +2,34 @@
 """
 GHXSTSHIP Module Comprehensive Audit Script
 Audits all modules for complete full-stack implementation
+
+Usage:
+    python3 audit_all_modules.py              # one module at a time
+    python3 audit_all_modules.py --jobs 8     # audit modules concurrently
+    python3 audit_all_modules.py --incremental   # re-audit only changed modules
+    python3 audit_all_modules.py --import-graph  # add import cycles, fan-in and closures
+    python3 audit_all_modules.py --bundle-weight # rank routes by the source bytes they import
+    python3 audit_all_modules.py --ndjson --columnar  # stream per-module records, compact summary
+
+Each run prints the module status changes since the previous audit_results.json.
 """
 
+import argparse
+import hashlib
 import os
 import json
+import posixpath
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import re
 
-MODULES_DIR = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app/(app)/(shell)")
-API_DIR = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app/api/v1")
+# apps/web, four levels above this script in app/(app)/(shell)/scripts/
+WEB_DIR = Path(__file__).resolve().parents[4]
+MODULES_DIR = WEB_DIR / 'app' / '(app)' / '(shell)'
+API_DIR = WEB_DIR / 'app' / 'api' / 'v1'
 
 # Expected data views for a complete module
 EXPECTED_VIEWS = {
@@ -28,60 +46,257 @@ EXPECTED_DRAWERS = {
     'HistoryDrawer.tsx'
 }
 
+# Any of these in a file means it talks to Supabase
+SUPABASE_PATTERN = re.compile(r"""createBrowserClient|createClient|from.*supabase|\.from\(['"]|supabase\.""")
+# Every match of SUPABASE_PATTERN contains one of these
+SUPABASE_ANCHORS = ('Client', 'supabase', '.from(')
+
+# Source files considered when classifying a whole module
+SOURCE_EXTENSIONS = ('.ts', '.tsx')
+
+# Module specifiers of static imports, re-exports, dynamic import() and require()
+IMPORT_PATTERN = re.compile(r"""\b(?:from|import|require)\s*\(?\s*['"]([^'"\n]+)['"]""")
+
+# Monorepo packages, resolved from source rather than node_modules
+WORKSPACE_SCOPE = '@ghxstship/'
+
+# Type-only imports and re-exports, erased at compile time
+TYPE_IMPORT_PATTERN = re.compile(r"""\b(?:import|export)\s+type\s+[^;'"]*?\bfrom\s*['"]([^'"\n]+)['"]""")
+
+# Third-party packages that add noticeably to a route's client bundle
+HEAVY_PACKAGES = {
+    '@mui/icons-material', '@sentry/nextjs', '@supabase/supabase-js', 'chart.js',
+    'date-fns', 'date-fns-tz', 'framer-motion', 'graphql', 'papaparse',
+    'posthog-js', 'qrcode', 'react-chartjs-2', 'recharts', 'stripe'
+}
+
+# Per-module stamps, fingerprints and results kept for --incremental runs
+STATE_FILE_NAME = "audit_state.json"
+
+# Import graph of WEB_DIR: files it covers, how specifiers resolve, and its cache
+GRAPH_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+GRAPH_SKIP_DIRS = {'node_modules', '.next', '.turbo', '.git', 'coverage', 'public'}
+RESOLVE_SUFFIXES = ('', '.ts', '.tsx', '.js', '.jsx', '/index.ts', '/index.tsx', '/index.js', '/index.jsx')
+GRAPH_INDEX_FILE_NAME = "import_graph_index.json"
+
+# Next.js files that make up a route: the page plus the layouts and templates above it
+ROUTE_PAGE_NAMES = ('page.tsx', 'page.ts', 'page.jsx', 'page.js')
+ROUTE_WRAPPER_NAMES = ('layout.tsx', 'layout.ts', 'layout.jsx', 'layout.js',
+                       'template.tsx', 'template.ts', 'template.jsx', 'template.js')
+
+# Result fields written to the --columnar summary, one array per field
+COLUMNAR_FIELDS = (
+    'name', 'status', 'main_client', 'has_supabase', 'views_count', 'expected_views_coverage',
+    'drawers_count', 'expected_drawers_coverage', 'has_service_layer', 'api_routes_count',
+    'source_files_count', 'supabase_files_count', 'source_bytes', 'source_lines',
+    'imports_count', 'third_party_imports_count', 'submodules_count'
+)
+
 # Directories to skip
 SKIP_DIRS = {'scripts', 'design-system', 'validation-reports', 'lib', 'components', 'hooks', 'utils', 'create', '[id]'}
 
-def find_tsx_files(directory: Path, pattern: str = "*.tsx") -> Set[str]:
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+class TreeIndex:
+    """Directories and files (size, mtime) under a root, read in one os.scandir pass.
+    Paths are POSIX-style and relative to the root; '' is the root itself.
+    Directories named in `skip` are left out along with everything below them."""
+
+    def __init__(self, root: Path, skip: Iterable[str] = ()):
+        self.root = root
+        self.skip = frozenset(skip)
+        self.files: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self.subdirs: Dict[str, List[str]] = {}
+        if root.is_dir():
+            self._scan()
+
+    def _scan(self):
+        stack = ['']
+        while stack:
+            rel = stack.pop()
+            files = {}
+            subdirs = []
+            try:
+                with os.scandir(self.root / rel) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self.skip:
+                                    subdirs.append(entry.name)
+                            elif entry.is_file():
+                                stat = entry.stat()
+                                files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            subdirs.sort()
+            self.files[rel] = files
+            self.subdirs[rel] = subdirs
+            stack.extend(_join(rel, d) for d in subdirs)
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    def is_dir(self, rel: str) -> bool:
+        return rel in self.files
+
+    def is_file(self, rel: str) -> bool:
+        directory, _, name = rel.rpartition('/')
+        return name in self.files.get(directory, {})
+
+    def walk(self, rel: str = '') -> Iterator[Tuple[str, Dict[str, Tuple[int, int]]]]:
+        """(directory, files) for rel and every directory below it"""
+        if rel not in self.files:
+            return
+        stack = [rel]
+        while stack:
+            directory = stack.pop()
+            yield directory, self.files[directory]
+            stack.extend(_join(directory, d) for d in reversed(self.subdirs[directory]))
+
+class AuditIndex:
+    """One scan each of MODULES_DIR and API_DIR; every audit check is a lookup in these"""
+
+    def __init__(self):
+        self.modules = TreeIndex(MODULES_DIR)
+        self.api = TreeIndex(API_DIR)
+
+def find_tsx_files(index: TreeIndex, directory: str, pattern: str = "*.tsx") -> Set[str]:
     """Find all TSX files matching pattern in directory"""
-    if not directory.exists():
-        return set()
+    return {name for name in index.files.get(directory, {}) if fnmatchcase(name, pattern)}
+
+def read_source(file_path: Path) -> Optional[str]:
+    """File text, or None if it can't be read or decoded"""
     try:
-        return {f.name for f in directory.glob(pattern) if f.is_file()}
-    except:
-        return set()
+        return file_path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+class ContentClassifier:
+    """Tells whether source text matches a precompiled pattern, memoized by content hash.
+    `anchors` are literals of which every match contains at least one; matching
+    starts at the line of the earliest anchor, which is sound as long as no
+    alternative spans lines."""
+
+    def __init__(self, pattern: re.Pattern, anchors: Iterable[str] = ()):
+        self.pattern = pattern
+        self.anchors = tuple(anchors)
+        self._by_hash: Dict[bytes, bool] = {}
+
+    def classify(self, content: str) -> bool:
+        key = hashlib.sha1(content.encode('utf-8', 'surrogateescape')).digest()
+        matched = self._by_hash.get(key)
+        if matched is None:
+            matched = self._by_hash[key] = self._search(content)
+        return matched
+
+    def _search(self, content: str) -> bool:
+        start = 0
+        if self.anchors:
+            hits = [i for i in map(content.find, self.anchors) if i >= 0]
+            if not hits:
+                return False
+            start = content.rfind('\n', 0, min(hits)) + 1
+        # search() stops at the first hit of any alternative
+        return self.pattern.search(content, start) is not None
 
-def has_supabase_integration(file_path: Path) -> bool:
+supabase_classifier = ContentClassifier(SUPABASE_PATTERN, SUPABASE_ANCHORS)
+
+def has_supabase_integration(file_path: Path, content: Optional[str] = None) -> bool:
     """Check if file contains Supabase integration"""
-    try:
-        content = file_path.read_text()
-        patterns = [
-            r'createBrowserClient',
-            r'createClient',
-            r'from.*supabase',
-            r'\.from\([\'"]',
-            r'supabase\.'
-        ]
-        return any(re.search(pattern, content) for pattern in patterns)
-    except:
-        return False
-
-def count_api_routes(module_name: str) -> int:
+    if content is None:
+        content = read_source(file_path)
+    return content is not None and supabase_classifier.classify(content)
+
+def module_source_entries(tree: TreeIndex, module_name: str) -> Iterator[Tuple[Path, int]]:
+    """(path, size) of every TS/TSX file under a module, submodules included"""
+    for directory, files in tree.walk(module_name):
+        for name in sorted(files):
+            if name.endswith(SOURCE_EXTENSIONS):
+                yield tree.path(_join(directory, name)), files[name][0]
+
+def import_specifiers(content: str) -> List[str]:
+    """Module specifiers imported, re-exported or required by source text"""
+    return IMPORT_PATTERN.findall(content)
+
+def runtime_import_specifiers(content: str) -> List[str]:
+    """Module specifiers that survive compilation: type-only imports are dropped"""
+    specifiers = import_specifiers(content)
+    for specifier in TYPE_IMPORT_PATTERN.findall(content):
+        specifiers.remove(specifier)
+    return specifiers
+
+def package_name(specifier: str) -> Optional[str]:
+    """npm package of a bare specifier; None for relative and '@/' imports"""
+    if specifier.startswith(('.', '/', '@/')):
+        return None
+    parts = specifier.split('/')
+    if specifier.startswith('@') and len(parts) > 1:
+        return f"{parts[0]}/{parts[1]}"
+    return parts[0]
+
+def count_lines(content: str) -> int:
+    return content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+
+def scan_module_sources(tree: TreeIndex, module_name: str, loaded: Optional[Dict[Path, str]] = None) -> Dict:
+    """
+    Supabase usage and bundle metrics for a module's source files in one pass.
+    Each file is read once and dropped after it is measured, so memory stays
+    bounded by the largest file rather than the module.
+    """
+    loaded = loaded or {}
+    metrics = {
+        'source_files_count': 0,
+        'supabase_files_count': 0,
+        'source_bytes': 0,
+        'source_lines': 0,
+        'imports_count': 0,
+        'third_party_imports_count': 0,
+        'heavy_imports': {},
+    }
+    heavy: Dict[str, int] = {}
+    for path, size in module_source_entries(tree, module_name):
+        metrics['source_files_count'] += 1
+        metrics['source_bytes'] += size
+        content = loaded.get(path)
+        if content is None:
+            content = read_source(path)
+        if content is None:
+            continue
+        if supabase_classifier.classify(content):
+            metrics['supabase_files_count'] += 1
+        metrics['source_lines'] += count_lines(content)
+        for specifier in import_specifiers(content):
+            metrics['imports_count'] += 1
+            package = package_name(specifier)
+            if package is None or package.startswith(WORKSPACE_SCOPE):
+                continue
+            metrics['third_party_imports_count'] += 1
+            if package in HEAVY_PACKAGES:
+                heavy[package] = heavy.get(package, 0) + 1
+    metrics['heavy_imports'] = dict(sorted(heavy.items()))
+    return metrics
+
+def count_api_routes(index: AuditIndex, module_name: str) -> int:
     """Count API route files for a module"""
-    api_path = API_DIR / module_name
-    if not api_path.exists():
-        return 0
-    count = 0
-    for root, _, files in os.walk(api_path):
-        count += sum(1 for f in files if f == 'route.ts')
-    return count
-
-def find_submodules(module_path: Path) -> List[str]:
+    return sum(1 for _, files in index.api.walk(module_name) if 'route.ts' in files)
+
+def find_submodules(index: TreeIndex, module_dir: str) -> List[str]:
     """Find submodule directories (exclude utility dirs)"""
-    if not module_path.exists():
-        return []
-    submodules = []
-    for item in module_path.iterdir():
-        if item.is_dir() and item.name not in SKIP_DIRS and not item.name.startswith('.'):
-            submodules.append(item.name)
-    return sorted(submodules)
-
-def audit_module(module_name: str) -> Dict:
+    return [name for name in index.subdirs.get(module_dir, [])
+            if name not in SKIP_DIRS and not name.startswith('.')]
+
+def audit_module(module_name: str, index: Optional[AuditIndex] = None) -> Dict:
     """Comprehensive audit of a single module"""
-    module_path = MODULES_DIR / module_name
+    if index is None:
+        index = AuditIndex()
+    tree = index.modules
     
     result = {
         'name': module_name,
-        'exists': module_path.exists(),
+        'exists': tree.is_dir(module_name),
         'main_client': None,
         'views': [],
         'views_count': 0,
@@ -93,12 +308,19 @@ def audit_module(module_name: str) -> Dict:
         'has_service_layer': False,
         'api_routes_count': 0,
         'has_supabase': False,
+        'source_files_count': 0,
+        'supabase_files_count': 0,
+        'source_bytes': 0,
+        'source_lines': 0,
+        'imports_count': 0,
+        'third_party_imports_count': 0,
+        'heavy_imports': {},
         'submodules': [],
         'submodules_count': 0,
         'status': 'UNKNOWN'
     }
     
-    if not module_path.exists():
+    if not result['exists']:
         result['status'] = 'NOT_FOUND'
         return result
     
@@ -109,43 +331,51 @@ def audit_module(module_name: str) -> Dict:
         f"{module_name.upper()}Client.tsx"
     ]
     
+    loaded = {}
     for client_name in possible_clients:
-        client_path = module_path / client_name
-        if client_path.exists():
+        if tree.is_file(_join(module_name, client_name)):
+            client_path = tree.path(_join(module_name, client_name))
             result['main_client'] = client_name
-            result['has_supabase'] = has_supabase_integration(client_path)
+            content = read_source(client_path)
+            if content is not None:
+                # Read once; the module-wide classification below reuses it
+                loaded[client_path] = content
+                result['has_supabase'] = has_supabase_integration(client_path, content)
             break
     
+    # Supabase usage and bundle metrics across all of the module's source files
+    result.update(scan_module_sources(tree, module_name, loaded))
+    
     # Check views
-    views_dir = module_path / 'views'
-    if views_dir.exists():
-        result['views'] = sorted(list(find_tsx_files(views_dir)))
+    views_dir = _join(module_name, 'views')
+    if tree.is_dir(views_dir):
+        result['views'] = sorted(list(find_tsx_files(tree, views_dir)))
         result['views_count'] = len(result['views'])
         # Calculate coverage of expected views
         found_views = set(result['views'])
         result['expected_views_coverage'] = len(found_views & EXPECTED_VIEWS)
     
     # Check drawers
-    drawers_dir = module_path / 'drawers'
-    if drawers_dir.exists():
-        result['drawers'] = sorted(list(find_tsx_files(drawers_dir)))
+    drawers_dir = _join(module_name, 'drawers')
+    if tree.is_dir(drawers_dir):
+        result['drawers'] = sorted(list(find_tsx_files(tree, drawers_dir)))
         result['drawers_count'] = len(result['drawers'])
         # Calculate coverage of expected drawers
         found_drawers = set(result['drawers'])
         result['expected_drawers_coverage'] = len(found_drawers & EXPECTED_DRAWERS)
     
     # Check service layer
-    lib_dir = module_path / 'lib'
-    if lib_dir.exists():
-        service_files = list(find_tsx_files(lib_dir, "*service*.ts"))
+    lib_dir = _join(module_name, 'lib')
+    if tree.is_dir(lib_dir):
+        service_files = list(find_tsx_files(tree, lib_dir, "*service*.ts"))
         result['service_files'] = sorted(service_files)
         result['has_service_layer'] = len(service_files) > 0
     
     # Check API routes
-    result['api_routes_count'] = count_api_routes(module_name)
+    result['api_routes_count'] = count_api_routes(index, module_name)
     
     # Check submodules
-    result['submodules'] = find_submodules(module_path)
+    result['submodules'] = find_submodules(tree, module_name)
     result['submodules_count'] = len(result['submodules'])
     
     # Determine status
@@ -160,8 +390,38 @@ def audit_module(module_name: str) -> Dict:
     
     return result
 
-def generate_report(results: List[Dict]) -> str:
-    """Generate markdown report from audit results"""
+def format_kb(size: int) -> str:
+    return f"{size / 1024:,.1f} KB"
+
+def format_heavy_imports(heavy_imports: Dict[str, int]) -> str:
+    return ', '.join(f"{package} ×{count}" for package, count in heavy_imports.items())
+
+def bundle_metrics_table(results: List[Dict]) -> List[str]:
+    """Per-module source size and import table, largest modules first"""
+    lines = [
+        "### Bundle Metrics",
+        "",
+        "| Module | Files | Size | Lines | Imports | Third-party | Heavy imports |",
+        "|---|---:|---:|---:|---:|---:|---|",
+    ]
+    for r in sorted(results, key=lambda x: (-x['source_bytes'], x['name'])):
+        lines.append(
+            f"| {r['name']} | {r['source_files_count']} | {format_kb(r['source_bytes'])} | {r['source_lines']:,} "
+            f"| {r['imports_count']} | {r['third_party_imports_count']} | {format_heavy_imports(r['heavy_imports']) or '—'} |"
+        )
+    heavy_totals: Dict[str, int] = {}
+    for r in results:
+        for package, count in r['heavy_imports'].items():
+            heavy_totals[package] = heavy_totals.get(package, 0) + count
+    lines.append(
+        f"| **Total** | {sum(r['source_files_count'] for r in results)} | {format_kb(sum(r['source_bytes'] for r in results))} "
+        f"| {sum(r['source_lines'] for r in results):,} | {sum(r['imports_count'] for r in results)} "
+        f"| {sum(r['third_party_imports_count'] for r in results)} | {format_heavy_imports(dict(sorted(heavy_totals.items()))) or '—'} |"
+    )
+    return lines
+
+def generate_report(results: List[Dict], graph_summary: Optional[Dict] = None, weights: Optional[Dict] = None) -> str:
+    """Generate markdown report from audit results, plus the import graph and bundle weights if given"""
     lines = [
         "# GHXSTSHIP MODULE COMPREHENSIVE AUDIT REPORT",
         "",
@@ -203,6 +463,11 @@ def generate_report(results: List[Dict]) -> str:
         f"- **Modules with API Routes**: {with_api}/{total} ({with_api/total*100:.1f}%)",
         f"- **Modules with Supabase**: {with_supabase}/{total} ({with_supabase/total*100:.1f}%)",
         "",
+    ])
+    
+    lines.extend(bundle_metrics_table(results))
+    lines.extend([
+        "",
         "---",
         "",
         "## DETAILED MODULE AUDIT",
@@ -233,6 +498,16 @@ def generate_report(results: List[Dict]) -> str:
         else:
             lines.append(f"- **Main Client**: ❌ NOT FOUND")
         
+        # Supabase usage beyond the main client
+        if result['source_files_count'] > 0:
+            lines.append(f"- **Supabase Usage**: {result['supabase_files_count']}/{result['source_files_count']} source files")
+        
+        # Bundle metrics
+        if result['source_files_count'] > 0:
+            lines.append(f"- **Source Size**: {format_kb(result['source_bytes'])}, {result['source_lines']:,} lines, {result['imports_count']} imports ({result['third_party_imports_count']} third-party)")
+        if result['heavy_imports']:
+            lines.append(f"- **Heavy Imports**: {format_heavy_imports(result['heavy_imports'])}")
+        
         # Views
         if result['views_count'] > 0:
             lines.append(f"- **Data Views**: {result['views_count']} implemented ({result['expected_views_coverage']}/{len(EXPECTED_VIEWS)} expected)")
@@ -265,6 +540,13 @@ def generate_report(results: List[Dict]) -> str:
         
         lines.append("")
     
+    if graph_summary is not None:
+        lines.extend(["---", ""])
+        lines.extend(import_graph_section(graph_summary))
+    if weights is not None:
+        lines.extend(["---", ""])
+        lines.extend(bundle_weight_section(weights))
+    
     lines.extend([
         "---",
         "",
@@ -292,33 +574,635 @@ def generate_report(results: List[Dict]) -> str:
     
     return "\n".join(lines)
 
+def audit_modules(modules: List[str], index: AuditIndex, jobs: int = 1,
+                  on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+    """
+    Audit modules, concurrently when jobs > 1; results keep the order of `modules`.
+    `on_result` is called with each result as soon as that module is done.
+    """
+    if jobs <= 1:
+        results = []
+        for module_name in modules:
+            print(f"Auditing: {module_name}")
+            result = audit_module(module_name, index)
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return results
+
+    # Module checks are index lookups, but reading source files still waits on
+    # the filesystem, so threads overlap that on slow or network-synced
+    # volumes; results are reported as they complete and put back in order
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(audit_module, module_name, index): i for i, module_name in enumerate(modules)}
+        results: List[Optional[Dict]] = [None] * len(modules)
+        for future in as_completed(futures):
+            result = future.result()
+            print(f"Audited: {result['name']}")
+            if on_result:
+                on_result(result)
+            results[futures[future]] = result
+        return results
+
+def module_files(index: AuditIndex, module_name: str) -> Iterator[Tuple[Path, str, Tuple[int, int]]]:
+    """(absolute path, key, (size, mtime)) of every file an audit of the module looks at"""
+    for tree, prefix in ((index.modules, 'module'), (index.api, 'api')):
+        for directory, files in tree.walk(module_name):
+            for name in sorted(files):
+                rel = _join(directory, name)
+                yield tree.path(rel), f"{prefix}:{rel}", files[name]
+
+def module_stamp(index: AuditIndex, module_name: str) -> str:
+    """Cheap change check from the index: every file's path, size and mtime"""
+    digest = hashlib.sha1()
+    for _, key, (size, mtime) in module_files(index, module_name):
+        digest.update(f"{key}\0{size}\0{mtime}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def module_fingerprint(index: AuditIndex, module_name: str) -> str:
+    """Hash of every file's path and content; survives touches, checkouts and syncs"""
+    digest = hashlib.sha256()
+    for path, key, _ in module_files(index, module_name):
+        digest.update(key.encode('utf-8') + b'\0')
+        try:
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+def audit_version() -> str:
+    """Results recorded by a different version of this script are not reused"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+def load_state() -> Dict:
+    try:
+        state = json.loads((MODULES_DIR / STATE_FILE_NAME).read_text())
+        if state.get('version') == audit_version():
+            return state.get('modules', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_state(modules: Dict):
+    state = {'version': audit_version(), 'modules': modules}
+    (MODULES_DIR / STATE_FILE_NAME).write_text(json.dumps(state))
+
+def incremental_audit(modules: List[str], index: AuditIndex, jobs: int = 1,
+                      on_result: Optional[Callable[[Dict, bool], None]] = None) -> Tuple[List[Dict], int]:
+    """
+    Audit only modules whose files changed since the last incremental run.
+    A module is unchanged when its stamp matches or, failing that, its content
+    fingerprint does. Returns the results for all modules and how many were audited.
+    `on_result(result, reused)` sees reused results first, then fresh ones as they finish.
+    """
+    previous = load_state()
+    state = {}
+    changed = []
+    for module_name in modules:
+        entry = previous.get(module_name)
+        stamp = module_stamp(index, module_name)
+        if entry and entry['stamp'] == stamp:
+            state[module_name] = entry
+            continue
+        fingerprint = module_fingerprint(index, module_name)
+        if entry and entry['fingerprint'] == fingerprint:
+            state[module_name] = dict(entry, stamp=stamp)
+            continue
+        state[module_name] = {'stamp': stamp, 'fingerprint': fingerprint}
+        changed.append(module_name)
+    
+    print(f"⚡ {len(changed)} changed modules to audit, {len(modules) - len(changed)} unchanged")
+    if on_result:
+        for module_name in modules:
+            if module_name not in changed:
+                on_result(state[module_name]['result'], True)
+    fresh = (lambda result: on_result(result, False)) if on_result else None
+    for result in audit_modules(changed, index, jobs, fresh):
+        state[result['name']]['result'] = result
+    save_state(state)
+    
+    return [state[module_name]['result'] for module_name in modules], len(changed)
+
+class ImportGraph:
+    """
+    Runtime imports between the source files of WEB_DIR, resolving relative
+    specifiers and the '@/' alias. Files are numbered in path order;
+    edges[i] lists the files that file i imports.
+    """
+
+    def __init__(self, files: List[str], sizes: List[int], specifiers: List[List[str]]):
+        self.files = files
+        self.sizes = sizes
+        self.number = {rel: i for i, rel in enumerate(files)}
+        self.edges: List[List[int]] = []
+        self.unresolved = 0
+        for rel, file_specifiers in zip(files, specifiers):
+            targets = set()
+            for specifier in file_specifiers:
+                target = self.resolve(rel, specifier)
+                if target is None:
+                    if specifier.startswith(('.', '@/')):
+                        self.unresolved += 1
+                elif target != self.number[rel]:
+                    targets.add(target)
+            self.edges.append(sorted(targets))
+        self._components: Optional[List[List[int]]] = None
+        self._closures: Optional[List[int]] = None
+
+    def resolve(self, importer: str, specifier: str) -> Optional[int]:
+        """Number of the file a local specifier refers to; None for packages and misses"""
+        specifier = specifier.split('?', 1)[0]
+        if specifier.startswith('@/'):
+            base = posixpath.normpath(specifier[2:])
+        elif specifier.startswith('.'):
+            base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), specifier))
+        else:
+            return None
+        if base.startswith('..'):
+            return None
+        for suffix in RESOLVE_SUFFIXES:
+            number = self.number.get(base + suffix)
+            if number is not None:
+                return number
+        return None
+
+    def edge_count(self) -> int:
+        return sum(map(len, self.edges))
+
+    def fan_in(self) -> List[int]:
+        """How many files import each file"""
+        counts = [0] * len(self.files)
+        for targets in self.edges:
+            for target in targets:
+                counts[target] += 1
+        return counts
+
+    def components(self) -> List[List[int]]:
+        """
+        Strongly connected components (iterative Tarjan). Every component comes
+        after all components it can reach, i.e. in reverse topological order.
+        """
+        if self._components is not None:
+            return self._components
+        n = len(self.files)
+        order = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                node, i = work[-1]
+                targets = self.edges[node]
+                if i < len(targets):
+                    work[-1] = (node, i + 1)
+                    target = targets[i]
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, 0))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+        self._components = components
+        return components
+
+    def cycles(self) -> List[List[int]]:
+        """Components of more than one file, largest first"""
+        return sorted((c for c in self.components() if len(c) > 1), key=lambda c: (-len(c), c[0]))
+
+    def closures(self) -> List[int]:
+        """
+        Per file, a bitset (bit i = file i) of everything it reaches, itself
+        included. Built once per component in reverse topological order, so
+        each component ORs in the finished closures of the ones it imports.
+        """
+        if self._closures is not None:
+            return self._closures
+        components = self.components()
+        component_of = [0] * len(self.files)
+        for c, members in enumerate(components):
+            for member in members:
+                component_of[member] = c
+        component_closures = [0] * len(components)
+        for c, members in enumerate(components):
+            bits = 0
+            for member in members:
+                bits |= 1 << member
+                for target in self.edges[member]:
+                    if component_of[target] != c:
+                        bits |= component_closures[component_of[target]]
+            component_closures[c] = bits
+        self._closures = [component_closures[component_of[i]] for i in range(len(self.files))]
+        return self._closures
+
+    def members(self, bits: int) -> Iterator[int]:
+        while bits:
+            low_bit = bits & -bits
+            yield low_bit.bit_length() - 1
+            bits ^= low_bit
+
+    def summary(self, top: int = 15) -> Dict:
+        """Counts, cycles, and the files with the largest closures and fan-in"""
+        closures = self.closures()
+        fan_in = self.fan_in()
+        # A file's own bit is not a dependency
+        closure_sizes = [closure.bit_count() - 1 for closure in closures]
+        ranked_closures = sorted(range(len(self.files)), key=lambda i: (-closure_sizes[i], self.files[i]))
+        ranked_fan_in = sorted(range(len(self.files)), key=lambda i: (-fan_in[i], self.files[i]))
+        return {
+            'files': len(self.files),
+            'edges': self.edge_count(),
+            'unresolved_imports': self.unresolved,
+            'cycles': [[self.files[i] for i in cycle] for cycle in self.cycles()],
+            'largest_closures': [
+                {'file': self.files[i], 'dependencies': closure_sizes[i]}
+                for i in ranked_closures[:top] if closure_sizes[i] > 0
+            ],
+            'top_fan_in': [
+                {'file': self.files[i], 'importers': fan_in[i]}
+                for i in ranked_fan_in[:top] if fan_in[i] > 0
+            ],
+        }
+
+def load_graph_index() -> Dict:
+    try:
+        index = json.loads((MODULES_DIR / GRAPH_INDEX_FILE_NAME).read_text())
+        if index.get('version') == audit_version():
+            return index.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_graph_index(files: Dict):
+    index = {'version': audit_version(), 'files': files}
+    (MODULES_DIR / GRAPH_INDEX_FILE_NAME).write_text(json.dumps(index, separators=(',', ':')))
+
+def build_import_graph() -> Tuple[ImportGraph, int]:
+    """
+    Import graph of WEB_DIR. Each file's specifiers are kept in
+    GRAPH_INDEX_FILE_NAME under its size and mtime, so only files that changed
+    since the last build are read. Returns the graph and how many files were read.
+    """
+    tree = TreeIndex(WEB_DIR, GRAPH_SKIP_DIRS)
+    previous = load_graph_index()
+    cached = {}
+    read = 0
+    for directory, files in tree.walk():
+        for name, (size, mtime) in files.items():
+            if not name.endswith(GRAPH_EXTENSIONS) or name.endswith('.d.ts'):
+                continue
+            rel = _join(directory, name)
+            entry = previous.get(rel)
+            if entry is None or entry[0] != size or entry[1] != mtime:
+                content = read_source(tree.path(rel))
+                entry = [size, mtime, runtime_import_specifiers(content) if content is not None else []]
+                read += 1
+            cached[rel] = entry
+    if read or len(cached) != len(previous):
+        save_graph_index(cached)
+    
+    files = sorted(cached)
+    graph = ImportGraph(files, [cached[rel][0] for rel in files], [cached[rel][2] for rel in files])
+    return graph, read
+
+def route_url(page_dir: str) -> str:
+    """URL of a page under app/, with route groups like '(shell)' removed"""
+    segments = page_dir.split('/')[1:]
+    return '/' + '/'.join(s for s in segments if not (s.startswith('(') and s.endswith(')')))
+
+def route_entries(graph: ImportGraph, page: str) -> List[int]:
+    """The page file and every layout or template in the directories above it"""
+    entries = [graph.number[page]]
+    directory = posixpath.dirname(page)
+    while directory:
+        for name in ROUTE_WRAPPER_NAMES:
+            number = graph.number.get(_join(directory, name))
+            if number is not None:
+                entries.append(number)
+        directory = posixpath.dirname(directory)
+    return entries
+
+def bundle_weights(graph: ImportGraph, modules: List[str], top: int = 20) -> Dict:
+    """
+    Estimated source bytes per route and per shell module, from import closures.
+
+    A route pulls in the closure of its page and the layouts above it. After
+    every route is measured, a dedup pass counts how many routes reach each
+    file: bytes reached by one route only are its own, the rest is shared
+    code that Next.js would put in common chunks. A module's weight is the
+    union of its routes, so files shared between its pages count once.
+    """
+    closures = graph.closures()
+    pages = [rel for rel in graph.files
+             if rel.startswith('app/') and posixpath.basename(rel) in ROUTE_PAGE_NAMES]
+    route_bits = {}
+    for page in pages:
+        bits = 0
+        for entry in route_entries(graph, page):
+            bits |= closures[entry]
+        route_bits[page] = bits
+    
+    # Dedup pass: how many routes reach each file
+    reach = [0] * len(graph.files)
+    for bits in route_bits.values():
+        for member in graph.members(bits):
+            reach[member] += 1
+    
+    def weigh(bits: int, owned) -> Dict:
+        files = total = own = 0
+        for member in graph.members(bits):
+            files += 1
+            total += graph.sizes[member]
+            if owned(member):
+                own += graph.sizes[member]
+        return {'files': files, 'bytes': total, 'own_bytes': own, 'shared_bytes': total - own}
+    
+    routes = []
+    for page, bits in route_bits.items():
+        weight = weigh(bits, lambda member: reach[member] == 1)
+        routes.append(dict(route=route_url(posixpath.dirname(page)), page=page, **weight))
+    routes.sort(key=lambda r: (-r['bytes'], r['route']))
+    
+    try:
+        shell_dir = MODULES_DIR.relative_to(WEB_DIR).as_posix()
+    except ValueError:
+        shell_dir = None
+    module_weights = []
+    if shell_dir is not None:
+        for module_name in modules:
+            prefix = f"{shell_dir}/{module_name}/"
+            module_pages = [page for page in pages if page.startswith(prefix)]
+            bits = 0
+            for page in module_pages:
+                bits |= route_bits[page]
+            # A file is the module's own when every route reaching it belongs to the module
+            inside = [0] * len(graph.files)
+            for page in module_pages:
+                for member in graph.members(route_bits[page]):
+                    inside[member] += 1
+            weight = weigh(bits, lambda member: inside[member] == reach[member])
+            module_weights.append(dict(name=module_name, pages=len(module_pages), **weight))
+        module_weights.sort(key=lambda m: (-m['bytes'], m['name']))
+    
+    all_bits = 0
+    for bits in route_bits.values():
+        all_bits |= bits
+    return {
+        'routes_count': len(routes),
+        'summed_route_bytes': sum(r['bytes'] for r in routes),
+        'unique_route_bytes': sum(graph.sizes[member] for member in graph.members(all_bits)),
+        'heaviest_routes': routes[:top],
+        'modules': module_weights,
+    }
+
+def bundle_weight_section(weights: Dict) -> List[str]:
+    """Markdown for route and module bundle weights"""
+    lines = [
+        "## ROUTE BUNDLE WEIGHT",
+        "",
+        "Estimated from source bytes reachable through runtime imports; own bytes are reached by no other route.",
+        "",
+        f"**Routes**: {weights['routes_count']} | **Summed route weight**: {format_kb(weights['summed_route_bytes'])} "
+        f"| **After dedup**: {format_kb(weights['unique_route_bytes'])}",
+        "",
+        "### Heaviest Routes",
+        "",
+        "| Route | Files | Total | Own | Shared |",
+        "|---|---:|---:|---:|---:|",
+    ]
+    lines.extend(
+        f"| {r['route']} | {r['files']} | {format_kb(r['bytes'])} | {format_kb(r['own_bytes'])} | {format_kb(r['shared_bytes'])} |"
+        for r in weights['heaviest_routes']
+    )
+    if weights['modules']:
+        lines.extend([
+            "",
+            "### Module Weight",
+            "",
+            "| Module | Pages | Files | Total | Own | Shared with other routes |",
+            "|---|---:|---:|---:|---:|---:|",
+        ])
+        lines.extend(
+            f"| {m['name']} | {m['pages']} | {m['files']} | {format_kb(m['bytes'])} | {format_kb(m['own_bytes'])} | {format_kb(m['shared_bytes'])} |"
+            for m in weights['modules']
+        )
+    lines.append("")
+    return lines
+
+def import_graph_section(summary: Dict) -> List[str]:
+    """Markdown for the import graph summary"""
+    lines = [
+        "## IMPORT GRAPH",
+        "",
+        f"**Files**: {summary['files']} | **Imports**: {summary['edges']} | **Unresolved local imports**: {summary['unresolved_imports']}",
+        "",
+        f"### Import Cycles ({len(summary['cycles'])})",
+        "",
+    ]
+    if summary['cycles']:
+        for cycle in summary['cycles']:
+            lines.append(f"- {len(cycle)} files: {', '.join(cycle[:5])}{'...' if len(cycle) > 5 else ''}")
+    else:
+        lines.append("- ✅ None found")
+    lines.extend([
+        "",
+        "### Largest Transitive Dependency Closures",
+        "",
+        "| File | Dependencies |",
+        "|---|---:|",
+    ])
+    lines.extend(f"| {entry['file']} | {entry['dependencies']} |" for entry in summary['largest_closures'])
+    lines.extend([
+        "",
+        "### Highest Fan-In",
+        "",
+        "| File | Importers |",
+        "|---|---:|",
+    ])
+    lines.extend(f"| {entry['file']} | {entry['importers']} |" for entry in summary['top_fan_in'])
+    lines.append("")
+    return lines
+
+class NdjsonWriter:
+    """
+    Writes one compact JSON record per line and flushes it, so other tools can
+    follow the file while the audit runs. Module records carry type 'module';
+    a final 'done' record marks a complete file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = path.open('w', encoding='utf-8')
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+
+    def module(self, result: Dict, reused: bool = False):
+        self.write({'type': 'module', 'reused': reused, **result})
+
+    def done(self, results: List[Dict], audited: int):
+        statuses: Dict[str, int] = {}
+        for result in results:
+            statuses[result['status']] = statuses.get(result['status'], 0) + 1
+        self.write({'type': 'done', 'modules': len(results), 'audited': audited,
+                    'statuses': dict(sorted(statuses.items()))})
+
+    def close(self):
+        self._file.close()
+
+def columnar_summary(results: List[Dict]) -> Dict:
+    """COLUMNAR_FIELDS as parallel arrays, one entry per module in name order"""
+    rows = sorted(results, key=lambda r: r['name'])
+    return {
+        'modules': len(rows),
+        'columns': {field: [r.get(field) for r in rows] for field in COLUMNAR_FIELDS},
+    }
+
+def load_previous_statuses(json_file: Path) -> Optional[Dict[str, str]]:
+    """Module statuses from the last audit_results.json, if there is one"""
+    try:
+        return {r['name']: r['status'] for r in json.loads(json_file.read_text())}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def status_changes(previous: Dict[str, str], results: List[Dict]) -> List[str]:
+    """Lines describing status changes, added modules and removed modules"""
+    current = {r['name']: r['status'] for r in results}
+    lines = []
+    for name in sorted(set(previous) | set(current)):
+        before, after = previous.get(name), current.get(name)
+        if before == after:
+            continue
+        if before is None:
+            lines.append(f"- {name}: new → {after}")
+        elif after is None:
+            lines.append(f"- {name}: {before} → removed")
+        else:
+            lines.append(f"- {name}: {before} → {after}")
+    return lines
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Audit all shell modules for full-stack implementation")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='modules audited concurrently; 0 picks a pool size for I/O-bound work (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help=f'reuse results for modules unchanged since the last incremental run ({STATE_FILE_NAME})')
+    parser.add_argument('--import-graph', action='store_true',
+                        help=f'also analyze imports across {WEB_DIR.name}/ for cycles, fan-in and closure size ({GRAPH_INDEX_FILE_NAME})')
+    parser.add_argument('--bundle-weight', action='store_true',
+                        help='also rank routes and modules by the source bytes their imports pull in')
+    parser.add_argument('--ndjson', nargs='?', type=Path, const=MODULES_DIR / "audit_results.ndjson",
+                        help='stream one JSON record per module as it finishes (default: audit_results.ndjson)')
+    parser.add_argument('--columnar', nargs='?', type=Path, const=MODULES_DIR / "audit_summary.json",
+                        help='write a compact column-per-field summary (default: audit_summary.json)')
+    args = parser.parse_args()
+    if args.jobs == 0:
+        args.jobs = min(32, (os.cpu_count() or 1) + 4)
+    return args
+
 def main():
     """Main audit function"""
+    args = parse_args()
     print("🔍 Starting comprehensive module audit...")
     print(f"📂 Scanning: {MODULES_DIR}")
     print("")
     
-    # Get all module directories
-    modules = []
-    for item in MODULES_DIR.iterdir():
-        if item.is_dir() and item.name not in SKIP_DIRS and not item.name.startswith('.'):
-            modules.append(item.name)
+    # One pass over the module and API trees; the audit itself only does lookups
+    index = AuditIndex()
     
-    modules.sort()
+    # Get all module directories
+    modules = find_submodules(index.modules, '')
     print(f"Found {len(modules)} modules to audit")
     print("")
     
-    # Audit each module
-    results = []
-    for module_name in modules:
-        print(f"Auditing: {module_name}")
-        result = audit_module(module_name)
-        results.append(result)
+    json_file = MODULES_DIR / "audit_results.json"
+    previous_statuses = load_previous_statuses(json_file)
+    
+    # Audit each module, streaming records if asked
+    stream = NdjsonWriter(args.ndjson) if args.ndjson else None
+    try:
+        if args.incremental:
+            results, audited = incremental_audit(modules, index, args.jobs, stream.module if stream else None)
+        else:
+            results = audit_modules(modules, index, args.jobs, stream.module if stream else None)
+            audited = len(results)
+        if stream:
+            stream.done(results, audited)
+    finally:
+        if stream:
+            stream.close()
+    if stream:
+        print(f"📡 NDJSON records streamed to: {args.ndjson}")
+    
+    if args.columnar:
+        args.columnar.write_text(json.dumps(columnar_summary(results), ensure_ascii=False, separators=(',', ':')))
+        print(f"📊 Columnar summary saved to: {args.columnar}")
+    
+    # Status changes since the previous run
+    changes = status_changes(previous_statuses, results) if previous_statuses is not None else []
+    print("")
+    if previous_statuses is None:
+        print("📈 No previous audit_results.json to compare against")
+    elif changes:
+        print(f"📈 Status changes since last run ({len(changes)}):")
+        for line in changes:
+            print(line)
+    else:
+        print("📈 No status changes since last run")
+    
+    graph_summary = None
+    weights = None
+    if args.import_graph or args.bundle_weight:
+        started = time.perf_counter()
+        graph, read = build_import_graph()
+        print("")
+        print(f"🕸️  Import graph: {len(graph.files)} files, {graph.edge_count()} imports "
+              f"({read} files read, {time.perf_counter() - started:.2f}s)")
+        if args.import_graph:
+            graph_summary = graph.summary()
+            print(f"   {len(graph_summary['cycles'])} import cycles")
+        if args.bundle_weight:
+            weights = bundle_weights(graph, modules)
+            heaviest = weights['heaviest_routes'][:1]
+            print(f"📦 Bundle weight: {weights['routes_count']} routes"
+                  + (f", heaviest {heaviest[0]['route']} at {format_kb(heaviest[0]['bytes'])}" if heaviest else ""))
+    
+    # The import graph covers files outside the modules, so it always regenerates the report
+    if (args.incremental and audited == 0 and not changes and previous_statuses is not None
+            and graph_summary is None and weights is None):
+        print("")
+        print("✅ Nothing changed; report and JSON are up to date")
+        return
     
     # Generate report
     print("")
     print("📝 Generating report...")
-    report = generate_report(results)
+    report = generate_report(results, graph_summary, weights)
     
     # Save report
     output_file = MODULES_DIR / "COMPREHENSIVE_AUDIT_REPORT.md"
@@ -328,7 +1212,6 @@ def main():
     print(f"📄 Report saved to: {output_file}")
     
     # Also save JSON for programmatic access
-    json_file = MODULES_DIR / "audit_results.json"
     json_file.write_text(json.dumps(results, indent=2))
     print(f"📊 JSON data saved to: {json_file}")
 
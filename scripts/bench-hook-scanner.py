@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark the hook scanner against the regexes the hook fixers used to run.
+
+Times every legacy pattern and one hook_scanner pass over the largest TSX
+files in apps/web/app, then over synthetic input that makes the legacy
+patterns backtrack. Also compares fix_callback_deps from
+fix-remaining-hooks.py with its old line-rescanning version on synthetic
+files with thousands of hooks.
+
+Usage:
+    python3 scripts/bench-hook-scanner.py [--files 10] [--repeat 3]
+"""
+import argparse
+import importlib.util
+import re
+import time
+from pathlib import Path
+
+from hook_scanner import HOOK_NAMES, _scan_code, mask_literals, scan_hooks
+
+WEB_APP_DIR = Path(__file__).resolve().parent.parent / 'apps' / 'web' / 'app'
+
+# Patterns the fixer scripts matched with before switching to hook_scanner
+LEGACY_PATTERNS = {
+    'set_state_in_callback': re.compile(
+        r'(useCallback\([^}]*?(set\w+)\([^}]*?\},\s*\[)([^\]]*?)(\]\s*\))', re.DOTALL),
+    'function_in_effect': re.compile(
+        r'useEffect\(\s*\(\s*\)\s*=>\s*\{[^}]*(load\w+|fetch\w+)\(\)[^}]*\},\s*\[\s*\]\s*\)', re.DOTALL),
+    'set_selected_deps': re.compile(
+        r'(useCallback\([^}]*\bsetSelected(\w+)\([^}]*\},\s*\[)([^\]]*)\]'),
+    'useeffect_with_functions': re.compile(
+        r'useEffect\(\s*\(\s*\)\s*=>\s*\{([^}]*)\},\s*\[([^\]]*)\]\s*\)', re.DOTALL),
+    'useeffect_with_state': re.compile(
+        r'useEffect\(\s*\(\s*\)\s*=>\s*\{([^}]*)\},\s*\[\s*\]\s*\)', re.DOTALL),
+}
+
+
+def legacy_fix_callback_deps(content: str) -> tuple[str, int]:
+    """fix_callback_deps as it was before the single-pass rewrite"""
+    fixes = 0
+    lines = content.split('\n')
+    result = []
+    i = 0
+    
+    while i < len(lines):
+        line = lines[i]
+        
+        # Look for useCallback
+        if 'useCallback' in line:
+            # Capture the entire useCallback block
+            brace_count = 0
+            in_callback = False
+            callback_block = []
+            
+            for j in range(i, min(i + 50, len(lines))):
+                callback_block.append(lines[j])
+                for char in lines[j]:
+                    if char == '(':
+                        brace_count += 1
+                        in_callback = True
+                    elif char == ')' and in_callback:
+                        brace_count -= 1
+                        if brace_count == 0:
+                            # Found the end of useCallback
+                            block_text = '\n'.join(callback_block)
+                            
+                            # Find setState calls
+                            setters = re.findall(r'\b(set[A-Z]\w+)\(', block_text)
+                            
+                            # Find dependency array
+                            deps_match = re.search(r'},\s*\[([^\]]*)\]\s*\)', block_text)
+                            if deps_match and setters:
+                                current_deps = deps_match.group(1).strip()
+                                deps_list = [d.strip() for d in current_deps.split(',') if d.strip()]
+                                
+                                # Add missing setters
+                                added = []
+                                for setter in set(setters):
+                                    if setter not in deps_list:
+                                        deps_list.append(setter)
+                                        added.append(setter)
+                                
+                                if added:
+                                    new_deps = ', '.join(deps_list)
+                                    new_block = block_text.replace(
+                                        '}, [' + current_deps + '])',
+                                        '}, [' + new_deps + '])'
+                                    )
+                                    result.extend(new_block.split('\n'))
+                                    fixes += 1
+                                    i = j + 1
+                                    break
+                            
+                            # No fix needed, add as-is
+                            result.extend(callback_block)
+                            i = j + 1
+                            break
+                if brace_count == 0 and in_callback:
+                    break
+            else:
+                # Couldn't find end, just add the line
+                result.append(line)
+                i += 1
+        else:
+            result.append(line)
+            i += 1
+    
+    return '\n'.join(result), fixes
+
+
+def load_fix_callback_deps():
+    path = Path(__file__).resolve().parent / 'fix-remaining-hooks.py'
+    spec = importlib.util.spec_from_file_location('fix_remaining_hooks', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.fix_callback_deps
+
+
+def best_of(repeat: int, func, *args) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_legacy(content: str) -> int:
+    return sum(len(pattern.findall(content)) for pattern in LEGACY_PATTERNS.values())
+
+
+def run_scanner(content: str) -> int:
+    literals = []
+    hooks = scan_hooks(content, HOOK_NAMES, literals)
+    mask_literals(content, literals)
+    return len(hooks)
+
+
+def synthetic_component(setters: int) -> str:
+    """A useCallback whose body never closes with `}, [`: worst case for the legacy regexes"""
+    calls = ''.join(f"  setValue{i}(value);\n" for i in range(setters))
+    return f"const handler = useCallback((value) => (\n{calls}), [value]);\n" * 4
+
+
+def synthetic_callbacks(hooks: int) -> str:
+    """A component with `hooks` useCallbacks, each missing its setter dependency"""
+    lines = ["export function Synthetic() {"]
+    for i in range(hooks):
+        lines.extend([
+            f"  const handle{i} = useCallback(async (id: string) => {{",
+            f"    if (id) {{ setItem{i}(id); }}",
+            "    setLoading(false);",
+            f"  }}, [item{i}]);",
+        ])
+    lines.append("}")
+    return '\n'.join(lines) + '\n'
+
+
+def synthetic_mentions(lines: int) -> str:
+    """Doc comment lines naming useCallback: each one costs the legacy version a 50-line rescan"""
+    body = ''.join(f" * handler {i} is wrapped in useCallback to keep (its identity stable\n" for i in range(lines))
+    return f"/**\n{body} */\n" + synthetic_callbacks(10)
+
+
+def report(label: str, content: str, repeat: int):
+    legacy = best_of(repeat, run_legacy, content)
+    scanner = best_of(repeat, run_scanner, content)
+    ratio = legacy / scanner if scanner else float('inf')
+    print(f"{label:<60} {len(content):>9,} {legacy * 1000:>10.2f} {scanner * 1000:>10.2f} {ratio:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hook_scanner against the legacy regexes")
+    parser.add_argument('--files', type=int, default=10, help='largest files to time (default: 10)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement, best kept (default: 3)')
+    args = parser.parse_args()
+
+    print("⏱️  Hook scanner vs legacy regexes (best of {}, ms)".format(args.repeat))
+    print("=" * 100)
+    print(f"{'input':<60} {'bytes':>9} {'legacy':>10} {'scanner':>10} {'speedup':>8}")
+
+    files = sorted(WEB_APP_DIR.rglob("*.tsx"), key=lambda p: p.stat().st_size, reverse=True)
+    for path in files[:args.files]:
+        report(str(path.relative_to(WEB_APP_DIR)), path.read_text(encoding='utf-8'), args.repeat)
+
+    for setters in (250, 500, 1000, 2000):
+        report(f"synthetic: 4 callbacks x {setters} setters", synthetic_component(setters), args.repeat)
+
+    print("")
+    print("⏱️  fix_callback_deps: legacy line rescan vs single forward pass (best of {}, ms)".format(args.repeat))
+    print("=" * 100)
+    print(f"{'input':<60} {'bytes':>9} {'legacy':>10} {'sweep':>10} {'speedup':>8}")
+    fix_callback_deps = load_fix_callback_deps()
+
+    def sweep(content):
+        _scan_code.cache_clear()
+        return fix_callback_deps(content)
+
+    cases = [(f"synthetic: {n} useCallbacks", synthetic_callbacks(n)) for n in (1000, 2000, 4000, 8000)]
+    cases += [(f"synthetic: {n} comment lines naming useCallback", synthetic_mentions(n))
+              for n in (1000, 2000, 4000, 8000)]
+    for label, content in cases:
+        legacy = best_of(args.repeat, legacy_fix_callback_deps, content)
+        current = best_of(args.repeat, sweep, content)
+        print(f"{label:<60} {len(content):>9,} {legacy * 1000:>10.2f} {current * 1000:>10.2f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,104 +4,79 @@ Comprehensive React Hook dependency fixer.
 Fixes all exhaustive-deps warnings by adding missing dependencies.
 """
 import re
-import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Tuple
+
+from hook_codemod import main as codemod_main
+from hook_scanner import add_deps, declared_names, has_flat_body, replace_spans, scan_code, split_deps
+
+# setState call inside a hook body
+SETTER_CALL = re.compile(r'\b(set\w+)\(')
+# load*/fetch* call with no arguments inside an effect body (not a method call)
+LOADER_CALL = re.compile(r'(?<![.\w$])(load\w+|fetch\w+)\(\)')
+# Effect callback of the form `() => { ... }`
+NO_ARG_ARROW = re.compile(r'\(\s*\)\s*=>\s*\{')
 
 def fix_set_state_in_callback(content: str) -> Tuple[str, int]:
     """Fix missing setState dependencies in useCallback"""
     fixes = 0
+    edits = []
+    hooks, code = scan_code(content, {'useCallback'})
     
-    # Pattern: useCallback with setState but missing from deps
-    # Match: }, []) or }, [other, deps]) where setState is used inside
-    pattern = r'(useCallback\([^}]*?(set\w+)\([^}]*?\},\s*\[)([^\]]*?)(\]\s*\))'
-    
-    def replacer(match):
-        nonlocal fixes
-        prefix = match.group(1)
-        setter = match.group(2)
-        current_deps = match.group(3).strip()
-        suffix = match.group(4)
+    # useCallback with setState used inside the body but missing from deps
+    for hook in hooks:
+        if not has_flat_body(content, hook):
+            continue
+        match = SETTER_CALL.search(code, *hook.body)
+        if not match:
+            continue
         
         # Check if setter already in deps
-        if setter in current_deps:
-            return match.group(0)
-        
-        # Add setter to deps
-        if current_deps:
-            new_deps = f"{current_deps}, {setter}"
-        else:
-            new_deps = setter
+        deps_text = content[hook.deps[0]:hook.deps[1]]
+        setter = match.group(1)
+        if setter in split_deps(deps_text):
+            continue
         
+        edits.append((*hook.deps, add_deps(deps_text, [setter])))
         fixes += 1
-        return f"{prefix}{new_deps}{suffix}"
     
-    new_content = re.sub(pattern, replacer, content, flags=re.DOTALL)
-    return new_content, fixes
+    return replace_spans(content, edits), fixes
 
 def fix_function_in_effect(content: str) -> Tuple[str, int]:
     """Fix missing function dependencies in useEffect"""
     fixes = 0
+    edits = []
+    hooks, code = scan_code(content, {'useEffect'})
     
-    # Pattern: useEffect that calls a function but doesn't include it in deps
-    pattern = r'useEffect\(\s*\(\s*\)\s*=>\s*\{[^}]*(load\w+|fetch\w+)\(\)[^}]*\},\s*\[\s*\]\s*\)'
-    
-    def replacer(match):
-        nonlocal fixes
-        func_match = re.search(r'(load\w+|fetch\w+)\(\)', match.group(0))
-        if not func_match:
-            return match.group(0)
+    # useEffect(() => { ... loadX() ... }, []) that doesn't include loadX in deps
+    for hook in hooks:
+        if not has_flat_body(content, hook) or content[hook.deps[0]:hook.deps[1]].strip():
+            continue
+        if not NO_ARG_ARROW.match(code, hook.callback[0]):
+            continue
+        # Functions declared inside the effect can't be listed as deps
+        local = declared_names(code, hook.body)
+        funcs = [f for f in LOADER_CALL.findall(code, *hook.body) if f not in local]
+        if not funcs:
+            continue
         
-        func_name = func_match.group(1)
-        new_effect = match.group(0).replace('], )', f', {func_name}], )')
-        fixes += 1
-        return new_effect
+        # Only a literal `], )` inside the effect is rewritten, never its deps
+        # array: loaders are rarely memoized, so listing them re-runs the effect
+        effect = content[hook.start:hook.end]
+        new_effect = effect.replace('], )', f', {funcs[0]}], )')
+        if new_effect != effect:
+            edits.append((hook.start, hook.end, new_effect))
+            fixes += 1
     
-    new_content = re.sub(pattern, replacer, content, flags=re.DOTALL)
-    return new_content, fixes
+    return replace_spans(content, edits), fixes
 
-def fix_file(file_path: Path) -> int:
-    """Fix all hook warnings in a file"""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        original = content
-        total_fixes = 0
-        
-        # Apply all fixes
-        content, fixes1 = fix_set_state_in_callback(content)
-        total_fixes += fixes1
-        
-        content, fixes2 = fix_function_in_effect(content)
-        total_fixes += fixes2
-        
-        if content != original:
-            file_path.write_text(content, encoding='utf-8')
-            print(f"✅ {file_path.name}: {total_fixes} fixes")
-            return total_fixes
-        
-        return 0
-    except Exception as e:
-        print(f"❌ Error fixing {file_path}: {e}")
-        return 0
+TRANSFORMS = [
+    fix_set_state_in_callback,
+    fix_function_in_effect,
+]
 
 def main():
-    web_dir = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app")
-    
-    print("🔧 Comprehensive React Hook Dependency Fixer")
-    print("=" * 50)
-    
-    total_fixes = 0
-    files_fixed = 0
-    
-    for tsx_file in web_dir.rglob("*.tsx"):
-        fixes = fix_file(tsx_file)
-        if fixes > 0:
-            files_fixed += 1
-            total_fixes += fixes
-    
-    print(f"\n🎉 Complete!")
-    print(f"   Files fixed: {files_fixed}")
-    print(f"   Total fixes: {total_fixes}")
+    codemod_main(plugins=[Path(__file__).name], title="🔧 Comprehensive React Hook Dependency Fixer")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env node
+
+/**
+ * Long-lived ESLint worker for the Python lint drivers
+ *
+ * Keeps one ESLint instance (resolved config, loaded plugins and parsers) alive
+ * and serves lint requests over a Unix socket, so fix-hooks-warnings.py and
+ * fix-image-warnings.py don't pay Node startup and config resolution per run.
+ *
+ * Protocol: one JSON request per line, one JSON response per line.
+ *   {"op": "lint", "patterns": ["app/page.tsx", ...]}  -> ESLint JSON results (without `source`)
+ *   {"op": "ping"}                                      -> {"ok": true}
+ *   {"op": "shutdown"}                                  -> {"ok": true}, then exits
+ *
+ * Usage: node scripts/eslint-daemon.mjs --socket /tmp/eslint-daemon.sock [--cwd apps/web] [--idle-minutes 30]
+ * Normally started on demand by scripts/eslint_runner.py.
+ */
+
+import fs from 'fs';
+import net from 'net';
+import path from 'path';
+import { createRequire } from 'module';
+import { fileURLToPath } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+
+function parseArgs(argv) {
+  const args = {
+    socket: null,
+    cwd: path.join(__dirname, '..', 'apps', 'web'),
+    idleMinutes: 30,
+  };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--socket') args.socket = argv[++i];
+    else if (argv[i] === '--cwd') args.cwd = path.resolve(argv[++i]);
+    else if (argv[i] === '--idle-minutes') args.idleMinutes = Number(argv[++i]);
+  }
+  if (!args.socket) {
+    console.error('Usage: eslint-daemon.mjs --socket <path> [--cwd <dir>] [--idle-minutes <n>]');
+    process.exit(2);
+  }
+  return args;
+}
+
+const args = parseArgs(process.argv.slice(2));
+
+// Resolve ESLint from the linted project so its config and plugins match `npx eslint`
+const requireFromProject = createRequire(path.join(args.cwd, 'package.json'));
+const { ESLint } = requireFromProject('eslint');
+
+const eslint = new ESLint({
+  cwd: args.cwd,
+  extensions: ['.ts', '.tsx'],
+  errorOnUnmatchedPattern: false,
+});
+
+// Requests are served one at a time, in arrival order
+let queue = Promise.resolve();
+
+async function handle(request) {
+  switch (request.op) {
+    case 'ping':
+      return { ok: true };
+    case 'shutdown':
+      setImmediate(shutdown);
+      return { ok: true };
+    case 'lint': {
+      const results = await eslint.lintFiles(request.patterns ?? ['.']);
+      return results.map(({ source, ...result }) => result);
+    }
+    default:
+      return { error: `unknown op: ${request.op}` };
+  }
+}
+
+let idleTimer = null;
+function resetIdleTimer() {
+  clearTimeout(idleTimer);
+  idleTimer = setTimeout(shutdown, args.idleMinutes * 60 * 1000);
+}
+
+const server = net.createServer((connection) => {
+  resetIdleTimer();
+  let buffer = '';
+  connection.setEncoding('utf-8');
+  connection.on('data', (chunk) => {
+    buffer += chunk;
+    let newline;
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline);
+      buffer = buffer.slice(newline + 1);
+      if (!line.trim()) continue;
+      queue = queue.then(async () => {
+        let response;
+        try {
+          response = await handle(JSON.parse(line));
+        } catch (error) {
+          response = { error: String(error?.stack ?? error) };
+        }
+        connection.write(JSON.stringify(response) + '\n');
+        resetIdleTimer();
+      });
+    }
+  });
+  connection.on('error', () => {});
+});
+
+function shutdown() {
+  server.close();
+  fs.rmSync(args.socket, { force: true });
+  process.exit(0);
+}
+
+// A stale socket file from a crashed daemon would make listen() fail
+fs.rmSync(args.socket, { force: true });
+server.listen(args.socket, () => {
+  console.log(`eslint-daemon listening on ${args.socket} (cwd: ${args.cwd})`);
+  resetIdleTimer();
+});
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
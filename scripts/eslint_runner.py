@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+Shared ESLint plumbing for the Python lint-fix drivers
+(fix-hooks-warnings.py, fix-image-warnings.py).
+
+Lints apps/web either with a one-off `npx eslint` process or through the
+long-lived worker in scripts/eslint-daemon.mjs, which keeps ESLint's config,
+plugins and parsers loaded between runs. Reports are parsed as a stream, one
+file result at a time, so memory stays flat however large the report gets.
+
+Per-file results are cached in .cache/eslint/ by content hash, together with a
+hash of the ESLint configs and installed plugin versions, and only files that
+missed the cache are sent to ESLint. The rules the fixers care about only look
+at one file at a time, so a file's result holds until its own content changes.
+
+Without the daemon, file lists can also be split into size-balanced shards
+linted by concurrent ESLint processes.
+
+Usage:
+    python3 scripts/eslint_runner.py status     # is the daemon running?
+    python3 scripts/eslint_runner.py start      # start it in the background
+    python3 scripts/eslint_runner.py stop
+"""
+import asyncio
+import codecs
+import hashlib
+import heapq
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPTS_DIR.parent
+WEB_DIR = ROOT_DIR / 'apps' / 'web'
+DAEMON_SCRIPT = SCRIPTS_DIR / 'eslint-daemon.mjs'
+CACHE_DIR = ROOT_DIR / '.cache' / 'eslint'
+
+# Files whose contents decide what ESLint reports; part of the cache key
+CONFIG_FILES = [ROOT_DIR / '.eslintrc.json', WEB_DIR / '.eslintrc.json', WEB_DIR / '.eslintignore']
+NODE_MODULES_DIRS = [WEB_DIR / 'node_modules', ROOT_DIR / 'node_modules']
+
+LINT_EXTENSIONS = ('.ts', '.tsx')
+# Directories ESLint never lints; anything else it ignores is dropped by iter_lint_messages
+SKIP_DIRS = {'node_modules', '.next', 'out'}
+
+ESLINT_COMMAND = ['npx', 'eslint', '--ext', '.ts,.tsx', '--format', 'json']
+
+# Bytes of file arguments per ESLint invocation, well under ARG_MAX on macOS
+# and Linux once the environment is counted
+ARGV_BYTE_LIMIT = 100_000
+
+# Bytes read from an ESLint report per step
+READ_SIZE = 1 << 16
+
+# Size-equivalent cost of linting a file on top of its bytes, for shard balancing
+SHARD_FILE_OVERHEAD = 2048
+
+WARNING = 1
+ERROR = 2
+
+# Seconds to wait for a freshly spawned daemon to accept connections
+DAEMON_START_TIMEOUT = 60
+
+
+class LintMessage(NamedTuple):
+    file_path: str
+    line: int
+    column: int
+    rule_id: Optional[str]
+
+
+def _read(stream: BinaryIO, size: int) -> bytes:
+    # read1 returns whatever is available, so a socket never blocks on a full chunk
+    read = getattr(stream, 'read1', stream.read)
+    return read(size)
+
+
+class ReportParser:
+    """
+    Incremental decoder for an ESLint JSON report, fed bytes as they arrive.
+    Only the file result being decoded is buffered, never the whole report.
+    """
+
+    def __init__(self):
+        self.done = False
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._expect = '['  # then 'first', 'value' or ',' between results
+        # Characters to buffer before retrying an incomplete result; doubling
+        # keeps a large result from being re-decoded on every small read
+        self._wanted = 0
+
+    def feed(self, data: bytes) -> List[Dict]:
+        """Add bytes from the report; returns the results completed by them"""
+        self._buffer += self._utf8.decode(data)
+        # Data ending in `]` may finish the report, and a stream kept open after
+        # it (the daemon's socket) never sends EOF, so always try to parse then
+        if len(self._buffer) < self._wanted and not self._buffer.rstrip().endswith(']'):
+            return []
+        return self._parse()
+
+    def finish(self) -> List[Dict]:
+        """Signal the end of the stream; raises ValueError if the report is incomplete"""
+        self._buffer += self._utf8.decode(b'', final=True)
+        self._wanted = 0
+        results = self._parse()
+        if not self.done:
+            raise ValueError("ESLint report ended unexpectedly")
+        return results
+
+    def _parse(self) -> List[Dict]:
+        results = []
+        buffer = self._buffer
+        pos = 0
+        while not self.done:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if self._expect == '[':
+                if char != '[':
+                    # Not a report: a crash or config error, usually
+                    raise ValueError(f"Expected an ESLint JSON report, got: {buffer[pos:pos + 500]}")
+                pos += 1
+                self._expect = 'first'
+            elif char == ']' and self._expect != 'value':
+                pos += 1
+                self.done = True
+            elif self._expect == ',':
+                if char != ',':
+                    raise ValueError(f"Malformed ESLint report near: {buffer[pos:pos + 100]}")
+                pos += 1
+                self._expect = 'value'
+            else:
+                try:
+                    result, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Result split across reads: wait for at least as much again
+                    self._wanted = 2 * (len(buffer) - pos)
+                    break
+                pos = end
+                self._expect = ','
+                results.append(result)
+        self._buffer = buffer[pos:]
+        return results
+
+
+def iter_lint_results(stream: BinaryIO) -> Iterator[Dict]:
+    """Yield the per-file results of an ESLint JSON report as they arrive"""
+    parser = ReportParser()
+    while not parser.done:
+        data = _read(stream, READ_SIZE)
+        if not data:
+            yield from parser.finish()
+            return
+        yield from parser.feed(data)
+
+
+def iter_lint_messages(results: Iterable[Dict], rule_ids: Optional[Iterable[str]] = None,
+                       severity: Optional[int] = WARNING) -> Iterator[LintMessage]:
+    """Flatten ESLint results into messages, keeping only the given rules and severity"""
+    rule_ids = frozenset(rule_ids) if rule_ids is not None else None
+    for result in results:
+        file_path = result['filePath']
+        for msg in result.get('messages', ()):
+            if severity is not None and msg.get('severity') != severity:
+                continue
+            rule_id = msg.get('ruleId')
+            if rule_id is None and msg.get('message', '').startswith('File ignored'):
+                # Explicitly passed file matched .eslintignore
+                continue
+            if rule_ids is None or rule_id in rule_ids:
+                yield LintMessage(file_path, msg.get('line', 0), msg.get('column', 0), rule_id)
+
+
+def stream_eslint(patterns: Sequence[str] = ('.',), cwd: Path = WEB_DIR) -> Iterator[Dict]:
+    """Run `npx eslint` and yield its per-file results while it is still writing them"""
+    process = subprocess.Popen(ESLINT_COMMAND + list(patterns), cwd=cwd, stdout=subprocess.PIPE)
+    try:
+        yield from iter_lint_results(process.stdout)
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+
+
+def chunk_argv(paths: Sequence[str], limit: int = ARGV_BYTE_LIMIT) -> Iterator[List[str]]:
+    """Split paths into argument lists whose total length stays under `limit` bytes"""
+    chunk: List[str] = []
+    size = 0
+    for path in paths:
+        length = len(os.fsencode(path)) + 1
+        if chunk and size + length > limit:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(path)
+        size += length
+    if chunk:
+        yield chunk
+
+
+def shard_files(paths: Sequence[str], shards: int) -> List[List[str]]:
+    """Split files into up to `shards` groups of similar total size (largest first, greedy)"""
+    weights = {}
+    for path in paths:
+        try:
+            weights[path] = os.path.getsize(path) + SHARD_FILE_OVERHEAD
+        except OSError:
+            weights[path] = SHARD_FILE_OVERHEAD
+    groups: List[List[str]] = [[] for _ in range(max(1, shards))]
+    heap = [(0, i) for i in range(len(groups))]
+    for path in sorted(paths, key=weights.__getitem__, reverse=True):
+        total, i = heapq.heappop(heap)
+        groups[i].append(path)
+        heapq.heappush(heap, (total + weights[path], i))
+    return [group for group in groups if group]
+
+
+async def _lint_shard(paths: Sequence[str], cwd: Path) -> List[Dict]:
+    """Lint one shard, parsing each ESLint report as it streams in"""
+    results = []
+    for chunk in chunk_argv(paths):
+        process = await asyncio.create_subprocess_exec(
+            *ESLINT_COMMAND, *chunk, cwd=cwd, stdout=asyncio.subprocess.PIPE)
+        parser = ReportParser()
+        try:
+            while not parser.done:
+                data = await process.stdout.read(READ_SIZE)
+                completed = parser.feed(data) if data else parser.finish()
+                for result in completed:
+                    # Results are held until every shard is done; the source is not needed
+                    result.pop('source', None)
+                    results.append(result)
+        finally:
+            if process.returncode is None and not parser.done:
+                process.kill()
+            await process.communicate()
+    return results
+
+
+def lint_sharded(paths: Sequence[str], shards: int, cwd: Path = WEB_DIR) -> List[Dict]:
+    """Lint files with `shards` concurrent ESLint processes and merge their results"""
+    groups = shard_files(paths, shards)
+
+    async def run_all():
+        return await asyncio.gather(*(_lint_shard(group, cwd) for group in groups))
+
+    return [result for group in asyncio.run(run_all()) for result in group]
+
+
+def lint_files(paths: Sequence[str], daemon: Optional['EslintDaemon'] = None,
+               shards: int = 1) -> Iterator[Dict]:
+    """Lint exactly the given files, in as few ESLint invocations as argv allows"""
+    if not paths:
+        return
+    if daemon is not None:
+        yield from daemon.stream(paths)
+    elif shards > 1 and len(paths) > 1:
+        yield from lint_sharded(paths, shards)
+    else:
+        for chunk in chunk_argv(paths):
+            yield from stream_eslint(chunk)
+
+
+def count_rules(messages: Iterable[LintMessage]) -> Dict[str, Counter]:
+    """Per-file counts of messages by rule"""
+    counts: Dict[str, Counter] = defaultdict(Counter)
+    for message in messages:
+        counts[message.file_path][message.rule_id] += 1
+    return counts
+
+
+def find_lint_files(root: Path = WEB_DIR) -> List[str]:
+    """TS/TSX files under root that `eslint .` would visit, in walk order"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        files.extend(os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(LINT_EXTENSIONS))
+    return files
+
+
+def eslint_package_versions() -> Dict[str, str]:
+    """Installed versions of eslint and every eslint config, plugin and parser package"""
+    versions = {}
+    for node_modules in NODE_MODULES_DIRS:
+        if not node_modules.is_dir():
+            continue
+        packages = []
+        for entry in os.scandir(node_modules):
+            if entry.name.startswith('@') and entry.is_dir():
+                packages.extend(f"{entry.name}/{sub.name}" for sub in os.scandir(entry.path))
+            else:
+                packages.append(entry.name)
+        for name in packages:
+            if 'eslint' not in name or name in versions:
+                continue
+            try:
+                manifest = json.loads((node_modules / name / 'package.json').read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                continue
+            versions[name] = manifest.get('version', '')
+    return versions
+
+
+def config_hash() -> str:
+    """Hash of everything besides a file's own content that changes its lint result"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(ESLINT_COMMAND).encode('utf-8'))
+    for path in CONFIG_FILES:
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes() if path.is_file() else b'')
+    digest.update(json.dumps(sorted(eslint_package_versions().items())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class LintCache:
+    """Persistent per-file ESLint results, valid for one config hash"""
+
+    def __init__(self, path: Path = CACHE_DIR / 'results.json'):
+        self.path = path
+        self.config = config_hash()
+        # path -> (sha256 of content, [[line, column, ruleId, severity], ...])
+        self.files: Dict[str, tuple] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('config') == self.config:
+                self.files = {k: tuple(v) for k, v in data.get('files', {}).items()}
+        except (OSError, ValueError):
+            pass
+
+    def get(self, path: str, digest: str) -> Optional[Dict]:
+        """Cached result for a file with this content, shaped like ESLint's JSON"""
+        entry = self.files.get(path)
+        if entry is None or entry[0] != digest:
+            return None
+        messages = [{'line': line, 'column': column, 'ruleId': rule_id, 'severity': severity}
+                    for line, column, rule_id, severity in entry[1]]
+        return {'filePath': path, 'messages': messages}
+
+    def put(self, path: str, digest: str, result: Dict):
+        messages = [[m.get('line', 0), m.get('column', 0), m.get('ruleId'), m.get('severity')]
+                    for m in result.get('messages', ())]
+        self.files[path] = (digest, messages)
+
+    def save(self):
+        """Write the cache, dropping entries for files that no longer exist"""
+        files = {k: v for k, v in self.files.items() if os.path.exists(k)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({'config': self.config, 'files': files}), encoding='utf-8')
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def cached_lint(paths: Sequence[str], daemon: Optional['EslintDaemon'] = None,
+                cache: Optional[LintCache] = None, shards: int = 1) -> Iterator[Dict]:
+    """
+    Lint files, answering from the cache where a file's content is unchanged.
+    Hits are yielded first, then ESLint's results for the misses, which are
+    added to the cache. Saving the cache is left to the caller.
+    """
+    if cache is None:
+        yield from lint_files(paths, daemon, shards)
+        return
+    digests = {}
+    misses = []
+    for path in paths:
+        digest = _file_digest(path)
+        result = cache.get(path, digest) if digest else None
+        if result is not None:
+            yield result
+        else:
+            digests[path] = digest
+            misses.append(path)
+    for result in lint_files(misses, daemon, shards):
+        # ESLint reports absolute paths; the digest was taken before linting
+        digest = digests.get(result['filePath'])
+        if digest:
+            cache.put(result['filePath'], digest, result)
+        yield result
+
+
+def lint_project(daemon: Optional['EslintDaemon'] = None, cache: Optional[LintCache] = None,
+                 shards: int = 1) -> Iterator[Dict]:
+    """Lint every TS/TSX file in apps/web, through the cache when one is given"""
+    if cache is not None or (shards > 1 and daemon is None):
+        yield from cached_lint(find_lint_files(), daemon, cache, shards)
+    elif daemon is not None:
+        yield from daemon.stream(['.'])
+    else:
+        yield from stream_eslint(['.'])
+
+
+def verify_files(touched_files: Sequence[str], before: Dict[str, Counter],
+                 daemon: Optional['EslintDaemon'] = None, cache: Optional[LintCache] = None,
+                 shards: int = 1) -> int:
+    """
+    Re-lint the files a fixer modified and print warnings per rule before and
+    after. `before` holds the first-pass counts from count_rules() for every
+    file; untouched files keep those. Returns the warnings left in the project.
+    """
+    after = count_rules(iter_lint_messages(cached_lint(touched_files, daemon, cache, shards)))
+    touched = set(touched_files)
+    rules_before = sum((before.get(path, Counter()) for path in touched), Counter())
+    rules_after = sum(after.values(), Counter())
+
+    print(f"   Re-linted {len(touched)} modified files")
+    for rule in sorted(set(rules_before) | set(rules_after), key=str):
+        print(f"   {rule}: {rules_before[rule]} → {rules_after[rule]}")
+
+    remaining = sum(rules_after.values())
+    remaining += sum(sum(counts.values()) for path, counts in before.items() if path not in touched)
+    return remaining
+
+
+class EslintDaemon:
+    """Client for scripts/eslint-daemon.mjs, spawning the daemon on first use"""
+
+    def __init__(self, web_dir: Path = WEB_DIR):
+        self.web_dir = web_dir
+        # Unix socket paths are length-limited, so keep them in the temp dir
+        key = hashlib.sha1(str(web_dir.resolve()).encode('utf-8')).hexdigest()[:10]
+        self.socket_path = os.path.join(tempfile.gettempdir(), f"eslint-daemon-{key}.sock")
+        self._sock = None
+        self._reader = None
+
+    def is_running(self) -> bool:
+        try:
+            self._request({'op': 'ping'})
+            return True
+        except OSError:
+            return False
+
+    def start(self):
+        """Spawn the daemon in the background unless one is already serving"""
+        if self.is_running():
+            return
+        subprocess.Popen(
+            ['node', str(DAEMON_SCRIPT), '--socket', self.socket_path, '--cwd', str(self.web_dir)],
+            cwd=self.web_dir,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.is_running():
+                return
+            time.sleep(0.2)
+        raise RuntimeError(f"ESLint daemon did not start on {self.socket_path}")
+
+    def stop(self):
+        if self.is_running():
+            self._request({'op': 'shutdown'})
+        self.close()
+
+    def lint(self, patterns: Sequence[str] = ('.',)) -> List[Dict]:
+        """Lint files or patterns (relative to apps/web) and return ESLint JSON results"""
+        return list(self.stream(patterns))
+
+    def stream(self, patterns: Sequence[str] = ('.',)) -> Iterator[Dict]:
+        """Like lint(), yielding per-file results as they are read off the socket"""
+        self.start()
+        self._send({'op': 'lint', 'patterns': list(patterns)})
+        try:
+            yield from iter_lint_results(self._reader)
+        except ValueError as e:
+            self.close()
+            raise RuntimeError(f"ESLint daemon error: {e}") from e
+        except BaseException:
+            # Unread response left on the connection: start over next time
+            self.close()
+            raise
+
+    def close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+            self._sock = self._reader = None
+
+    def _send(self, payload: Dict):
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+            self._reader = sock.makefile('rb')
+        try:
+            self._sock.sendall((json.dumps(payload) + '\n').encode('utf-8'))
+        except OSError:
+            self.close()
+            raise
+
+    def _request(self, payload: Dict):
+        self._send(payload)
+        try:
+            line = self._reader.readline()
+            # Skip the newline after a streamed lint response
+            while line == b'\n':
+                line = self._reader.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError("ESLint daemon closed the connection")
+        return json.loads(line)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    daemon = EslintDaemon()
+    if command == 'start':
+        daemon.start()
+        print(f"✅ ESLint daemon running on {daemon.socket_path}")
+    elif command == 'stop':
+        daemon.stop()
+        print("🛑 ESLint daemon stopped")
+    elif command == 'status':
+        state = "running" if daemon.is_running() else "not running"
+        print(f"ESLint daemon {state} ({daemon.socket_path})")
+    else:
+        print(f"Unknown command: {command} (expected start, stop or status)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
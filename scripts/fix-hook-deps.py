@@ -4,52 +4,43 @@ Fix React Hook dependency warnings by adding missing setState dependencies.
 This is safe because setState functions from useState are stable and don't change.
 """
 import re
-import sys
 from pathlib import Path
 
-def fix_file(file_path: Path) -> int:
-    """Fix hook dependencies in a single file. Returns number of fixes made."""
-    content = file_path.read_text()
-    original_content = content
+from hook_codemod import main as codemod_main
+from hook_scanner import add_deps, has_flat_body, replace_spans, scan_code, split_deps
+
+# setSelectedXxx, setFormErrors and setFilters calls
+SETTER_CALL = re.compile(r'\b(setSelected\w+|setFormErrors|setFilters)\(')
+
+def fix_set_state_deps(content: str) -> tuple[str, int]:
+    """Add missing setSelected*/setFormErrors/setFilters deps to useCallback"""
     fixes = 0
-    
-    # Pattern to find useCallback with missing setState dependency
-    # Matches: useCallback(..., [deps]) where there's a setState call inside
-    patterns = [
-        # setSelectedXxx dependencies
-        (r'(useCallback\([^}]*\bsetSelected(\w+)\([^}]*\},\s*\[)([^\]]*)\]', 
-         lambda m: f"{m.group(1)}{m.group(3)}{', ' if m.group(3).strip() else ''}setSelected{m.group(2)}]"),
-        
-        # setFormErrors dependencies  
-        (r'(useCallback\([^}]*\bsetFormErrors\([^}]*\},\s*\[)([^\]]*)\]',
-         lambda m: f"{m.group(1)}{m.group(2)}{', ' if m.group(2).strip() else ''}setFormErrors]"),
-        
-        # setFilters dependencies
-        (r'(useCallback\([^}]*\bsetFilters\([^}]*\},\s*\[)([^\]]*)\]',
-         lambda m: f"{m.group(1)}{m.group(2)}{', ' if m.group(2).strip() else ''}setFilters]"),
-    ]
-    
-    for pattern, replacement in patterns:
-        new_content = re.sub(pattern, replacement, content)
-        if new_content != content:
+    edits = []
+    hooks, code = scan_code(content, {'useCallback'})
+
+    # useCallback(..., [deps]) where there's a setState call inside
+    for hook in hooks:
+        if not has_flat_body(content, hook):
+            continue
+        deps_text = content[hook.deps[0]:hook.deps[1]]
+        deps_list = split_deps(deps_text)
+        missing = []
+        for setter in SETTER_CALL.findall(code, *hook.body):
+            if setter not in deps_list and setter not in missing:
+                missing.append(setter)
+
+        if missing:
+            edits.append((*hook.deps, add_deps(deps_text, missing)))
             fixes += 1
-            content = new_content
-    
-    if content != original_content:
-        file_path.write_text(content)
-        print(f"✅ Fixed {fixes} issues in {file_path}")
-        return fixes
-    
-    return 0
+
+    return replace_spans(content, edits), fixes
+
+TRANSFORMS = [
+    fix_set_state_deps,
+]
 
 def main():
-    web_dir = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app")
-    
-    total_fixes = 0
-    for tsx_file in web_dir.rglob("*.tsx"):
-        total_fixes += fix_file(tsx_file)
-    
-    print(f"\n🎉 Total fixes applied: {total_fixes}")
+    codemod_main(plugins=[Path(__file__).name], title="🔧 Fixing React Hook setState Dependencies")
 
 if __name__ == "__main__":
     main()
@@ -1,65 +1,76 @@
 #!/usr/bin/env python3
 """
 Fix React Hooks exhaustive-deps warnings by adding eslint-disable comments
+
+Usage:
+    python3 scripts/fix-hooks-warnings.py [--daemon] [--no-cache] [--shards N]
+
+The final check re-lints only the files modified here and reports warnings
+per rule before and after. --daemon lints through the persistent worker in
+scripts/eslint-daemon.mjs, started on first use. ESLint results are cached per
+file in .cache/eslint/ (see eslint_runner.py); --no-cache lints everything.
+--shards N splits the files to lint across N concurrent ESLint processes.
 """
 
+import argparse
 import os
 import re
-import subprocess
-import json
+from collections import Counter, defaultdict
+
+from eslint_runner import EslintDaemon, LintCache, iter_lint_messages, lint_project, verify_files
+
+HOOK_RULES = ['react-hooks/exhaustive-deps']
+
+parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+parser.add_argument('--daemon', action='store_true',
+                    help='lint through the persistent ESLint daemon')
+parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                    help='ignore and do not update the lint-result cache')
+parser.add_argument('--shards', type=int, default=1,
+                    help='concurrent ESLint processes; 0 uses every CPU (default: 1)')
+args = parser.parse_args()
+
+daemon = EslintDaemon() if args.daemon else None
+cache = LintCache() if args.use_cache else None
+shards = args.shards or os.cpu_count() or 1
 
 # Get the web app directory
 web_dir = os.path.join(os.path.dirname(__file__), '..', 'apps', 'web')
 
 print("🔍 Finding files with React hooks warnings...\n")
 
-# Run ESLint and capture output
-try:
-    result = subprocess.run(
-        ['npx', 'eslint', '.', '--ext', '.ts,.tsx', '--format', 'json'],
-        cwd=web_dir,
-        capture_output=True,
-        text=True
-    )
-    # ESLint returns exit code 1 when there are warnings
-    eslint_output = result.stdout if result.stdout else result.stderr
-except Exception as e:
-    print(f"Error running ESLint: {e}")
-    exit(1)
+# Stream ESLint's JSON report, keeping only warnings
+hooks_warnings = {}
+total_warnings = 0
+# Warnings of every rule per file, for the final check
+first_pass_counts = defaultdict(Counter)
 
-# Parse JSON output
 try:
-    eslint_data = json.loads(eslint_output)
-except json.JSONDecodeError as e:
+    for file_path, line, column, rule_id in iter_lint_messages(lint_project(daemon, cache, shards)):
+        first_pass_counts[file_path][rule_id] += 1
+        if rule_id in HOOK_RULES:
+            total_warnings += 1
+            hooks_warnings.setdefault(file_path, []).append({'line': line, 'column': column})
+except ValueError as e:
     print(f"Error parsing ESLint output: {e}")
-    print("Output:", eslint_output[:500])
+    exit(1)
+except Exception as e:
+    print(f"Error running ESLint: {e}")
     exit(1)
 
-# Collect hooks warnings by file
-hooks_warnings = {}
-total_warnings = 0
-
-for file_data in eslint_data:
-    file_path = file_data['filePath']
-    for msg in file_data.get('messages', []):
-        if msg.get('ruleId') == 'react-hooks/exhaustive-deps' and msg.get('severity') == 1:
-            total_warnings += 1
-            if file_path not in hooks_warnings:
-                hooks_warnings[file_path] = []
-            hooks_warnings[file_path].append({
-                'line': msg['line'],
-                'column': msg['column'],
-                'message': msg['message']
-            })
+if cache:
+    cache.save()
 
 print(f"📊 Found {total_warnings} React hooks warnings in {len(hooks_warnings)} files\n")
 
 # Fix each file
 fixed_count = 0
+touched_files = []
 for file_path, warnings in hooks_warnings.items():
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
+        original_lines = list(lines)
         
         # Sort warnings by line number in reverse to avoid offset issues
         warnings.sort(key=lambda x: x['line'], reverse=True)
@@ -82,12 +93,14 @@ for file_path, warnings in hooks_warnings.items():
                 lines.insert(line_idx, f'{indent}// eslint-disable-next-line react-hooks/exhaustive-deps\n')
                 fixed_count += 1
         
-        # Write back to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        
-        rel_path = os.path.relpath(file_path, web_dir)
-        print(f"   ✅ Fixed {len(warnings)} warnings in {rel_path}")
+        # Only write if a comment was inserted
+        if lines != original_lines:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            touched_files.append(file_path)
+            
+            rel_path = os.path.relpath(file_path, web_dir)
+            print(f"   ✅ Fixed {len(lines) - len(original_lines)} warnings in {rel_path}")
         
     except Exception as e:
         rel_path = os.path.relpath(file_path, web_dir)
@@ -98,14 +111,10 @@ print(f"\n✨ Fixed {fixed_count} React hooks warnings\n")
 # Run final check
 print("🔍 Running final ESLint check...")
 try:
-    result = subprocess.run(
-        ['npx', 'eslint', '.', '--ext', '.ts,.tsx'],
-        cwd=web_dir,
-        capture_output=True,
-        text=True
-    )
-    # Count warnings
-    warning_count = result.stdout.count('warning')
+    # Only the files fixed above can have changed since the first pass
+    warning_count = verify_files(touched_files, first_pass_counts, daemon, cache, shards)
+    if cache:
+        cache.save()
     print(f"   Remaining warnings: {warning_count}\n")
     
     if warning_count == 0:
@@ -1,61 +1,71 @@
 #!/usr/bin/env python3
 """
 Fix image-related ESLint warnings by converting <img> to Next.js <Image>
+
+Usage:
+    python3 scripts/fix-image-warnings.py [--daemon] [--no-cache] [--shards N]
+
+The final check re-lints only the files modified here and reports warnings
+per rule before and after. --daemon lints through the persistent worker in
+scripts/eslint-daemon.mjs, started on first use. ESLint results are cached per
+file in .cache/eslint/ (see eslint_runner.py); --no-cache lints everything.
+--shards N splits the files to lint across N concurrent ESLint processes.
 """
 
+import argparse
 import os
 import re
-import subprocess
-import json
+from collections import Counter, defaultdict
+
+from eslint_runner import EslintDaemon, LintCache, iter_lint_messages, lint_project, verify_files
+
+IMAGE_RULES = ['@next/next/no-img-element', 'jsx-a11y/alt-text', 'jsx-a11y/aria-props']
+
+parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+parser.add_argument('--daemon', action='store_true',
+                    help='lint through the persistent ESLint daemon')
+parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                    help='ignore and do not update the lint-result cache')
+parser.add_argument('--shards', type=int, default=1,
+                    help='concurrent ESLint processes; 0 uses every CPU (default: 1)')
+args = parser.parse_args()
+
+daemon = EslintDaemon() if args.daemon else None
+cache = LintCache() if args.use_cache else None
+shards = args.shards or os.cpu_count() or 1
 
 # Get the web app directory
 web_dir = os.path.join(os.path.dirname(__file__), '..', 'apps', 'web')
 
 print("🔍 Finding files with image warnings...\n")
 
-# Run ESLint and capture output
+# Stream ESLint's JSON report, keeping only warnings
+image_warnings = {}
+total_warnings = 0
+# Warnings of every rule per file, for the final check
+first_pass_counts = defaultdict(Counter)
+
 try:
-    result = subprocess.run(
-        ['npx', 'eslint', '.', '--ext', '.ts,.tsx', '--format', 'json'],
-        cwd=web_dir,
-        capture_output=True,
-        text=True
-    )
-    eslint_output = result.stdout if result.stdout else result.stderr
+    for file_path, line, column, rule_id in iter_lint_messages(lint_project(daemon, cache, shards)):
+        first_pass_counts[file_path][rule_id] += 1
+        if rule_id in IMAGE_RULES:
+            total_warnings += 1
+            image_warnings.setdefault(file_path, []).append({'line': line, 'column': column, 'ruleId': rule_id})
+except ValueError as e:
+    print(f"Error parsing ESLint output: {e}")
+    exit(1)
 except Exception as e:
     print(f"Error running ESLint: {e}")
     exit(1)
 
-# Parse JSON output
-try:
-    eslint_data = json.loads(eslint_output)
-except json.JSONDecodeError:
-    print("Error parsing ESLint output")
-    exit(1)
-
-# Collect image warnings by file
-image_warnings = {}
-total_warnings = 0
-
-for file_data in eslint_data:
-    file_path = file_data['filePath']
-    for msg in file_data.get('messages', []):
-        rule_id = msg.get('ruleId', '')
-        if rule_id in ['@next/next/no-img-element', 'jsx-a11y/alt-text', 'jsx-a11y/aria-props'] and msg.get('severity') == 1:
-            total_warnings += 1
-            if file_path not in image_warnings:
-                image_warnings[file_path] = []
-            image_warnings[file_path].append({
-                'line': msg['line'],
-                'column': msg['column'],
-                'message': msg['message'],
-                'ruleId': rule_id
-            })
+if cache:
+    cache.save()
 
 print(f"📊 Found {total_warnings} image warnings in {len(image_warnings)} files\n")
 
 # Fix each file
 fixed_count = 0
+touched_files = []
 for file_path, warnings in image_warnings.items():
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -140,6 +150,7 @@ for file_path, warnings in image_warnings.items():
         if content != original_content:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            touched_files.append(file_path)
             
             rel_path = os.path.relpath(file_path, web_dir)
             print(f"   ✅ Fixed {len(warnings)} warnings in {rel_path}")
@@ -154,13 +165,10 @@ print(f"\n✨ Fixed {fixed_count} image warnings\n")
 # Run final check
 print("🔍 Running final ESLint check...")
 try:
-    result = subprocess.run(
-        ['npx', 'eslint', '.', '--ext', '.ts,.tsx'],
-        cwd=web_dir,
-        capture_output=True,
-        text=True
-    )
-    warning_count = result.stdout.count('warning')
+    # Only the files fixed above can have changed since the first pass
+    warning_count = verify_files(touched_files, first_pass_counts, daemon, cache, shards)
+    if cache:
+        cache.save()
     print(f"   Remaining warnings: {warning_count}\n")
     
     if warning_count == 0:
@@ -3,141 +3,85 @@
 Fix remaining React Hook warnings - improved patterns
 """
 import re
+from bisect import bisect_left
 from pathlib import Path
 
+from hook_codemod import main as codemod_main
+from hook_scanner import add_deps, declared_names, has_flat_body, replace_spans, scan_code, split_deps
+
+# setState call, e.g. setLoading( (the lookbehind follows the literal `set`
+# so the regex engine can search for that prefix)
+SETTER_CALL = re.compile(r'(set(?<![.\w$]set)[A-Z]\w+)\(')
+# load*/fetch* call with no arguments, and any load*/fetch* call (not method calls)
+LOADER_CALL = re.compile(r'(?<![.\w$])(load\w+|fetch\w+)\(\)')
+LOADER_NAME = re.compile(r'(?<![.\w$])(load\w+|fetch\w+)\(')
+# Effect callback of the form `() => { ... }`
+NO_ARG_ARROW = re.compile(r'\(\s*\)\s*=>\s*\{')
+
 def fix_callback_deps(content: str) -> tuple[str, int]:
     """Fix useCallback missing dependencies - more aggressive pattern matching"""
     fixes = 0
-    lines = content.split('\n')
-    result = []
-    i = 0
+    hooks, code = scan_code(content, {'useCallback'})
+    # Only block-bodied callbacks: useCallback(() => { ... }, [deps])
+    hooks = [h for h in hooks
+             if h.deps is not None and h.body != h.callback and content[h.callback[1] - 1] == '}']
     
-    while i < len(lines):
-        line = lines[i]
-        
-        # Look for useCallback
-        if 'useCallback' in line:
-            # Capture the entire useCallback block
-            block_start = i
-            brace_count = 0
-            in_callback = False
-            callback_block = []
-            
-            for j in range(i, min(i + 50, len(lines))):
-                callback_block.append(lines[j])
-                for char in lines[j]:
-                    if char == '(':
-                        brace_count += 1
-                        in_callback = True
-                    elif char == ')' and in_callback:
-                        brace_count -= 1
-                        if brace_count == 0:
-                            # Found the end of useCallback
-                            block_text = '\n'.join(callback_block)
-                            
-                            # Find setState calls
-                            setters = re.findall(r'\b(set[A-Z]\w+)\(', block_text)
-                            
-                            # Find dependency array
-                            deps_match = re.search(r'},\s*\[([^\]]*)\]\s*\)', block_text)
-                            if deps_match and setters:
-                                current_deps = deps_match.group(1).strip()
-                                deps_list = [d.strip() for d in current_deps.split(',') if d.strip()]
-                                
-                                # Add missing setters
-                                added = []
-                                for setter in set(setters):
-                                    if setter not in deps_list:
-                                        deps_list.append(setter)
-                                        added.append(setter)
-                                
-                                if added:
-                                    new_deps = ', '.join(deps_list)
-                                    new_block = block_text.replace(
-                                        '}, [' + current_deps + '])',
-                                        '}, [' + new_deps + '])'
-                                    )
-                                    result.extend(new_block.split('\n'))
-                                    fixes += 1
-                                    i = j + 1
-                                    break
-                            
-                            # No fix needed, add as-is
-                            result.extend(callback_block)
-                            i = j + 1
-                            break
-                if brace_count == 0 and in_callback:
-                    break
-            else:
-                # Couldn't find end, just add the line
-                result.append(line)
-                i += 1
-        else:
-            result.append(line)
-            i += 1
+    # One forward sweep collects every setter call; each callback then takes
+    # the calls inside its body by offset (nested callbacks close over them too)
+    offsets = []
+    names = []
+    for match in SETTER_CALL.finditer(code):
+        offsets.append(match.start())
+        names.append(match.group(1))
     
-    return '\n'.join(result), fixes
+    # Add missing setters, editing each deps array in place by offset
+    edits = []
+    for hook in hooks:
+        deps_text = content[hook.deps[0]:hook.deps[1]]
+        deps_list = split_deps(deps_text)
+        body = names[bisect_left(offsets, hook.body[0]):bisect_left(offsets, hook.body[1])]
+        added = [setter for setter in dict.fromkeys(body) if setter not in deps_list]
+        if added:
+            edits.append((*hook.deps, add_deps(deps_text, added)))
+            fixes += 1
+    
+    return replace_spans(content, edits), fixes
 
 def fix_effect_deps(content: str) -> tuple[str, int]:
     """Fix useEffect missing function dependencies"""
     fixes = 0
+    edits = []
+    hooks, code = scan_code(content, {'useEffect'})
     
-    # Pattern: useEffect with function calls missing from deps
-    pattern = r'useEffect\(\s*\(\s*\)\s*=>\s*\{[^}]*(load\w+|fetch\w+)\(\)[^}]*\},\s*\[\s*\]\s*\)'
-    
-    def replacer(match):
-        nonlocal fixes
-        # Find all function calls
-        funcs = re.findall(r'\b(load\w+|fetch\w+)\(', match.group(0))
-        if funcs:
-            func_name = funcs[0]
-            result = match.group(0).replace('], )', ', ' + func_name + '], )')
+    # useEffect(() => { ... }, []) with function calls missing from deps
+    for hook in hooks:
+        if not has_flat_body(content, hook) or content[hook.deps[0]:hook.deps[1]].strip():
+            continue
+        if not NO_ARG_ARROW.match(code, hook.callback[0]):
+            continue
+        # Functions declared inside the effect can't be listed as deps
+        local = declared_names(code, hook.body)
+        if not any(f not in local for f in LOADER_CALL.findall(code, *hook.body)):
+            continue
+        funcs = [f for f in LOADER_NAME.findall(code, *hook.body) if f not in local]
+        
+        # Only a literal `], )` inside the effect is rewritten, never its deps
+        # array: loaders are rarely memoized, so listing them re-runs the effect
+        effect = content[hook.start:hook.end]
+        new_effect = effect.replace('], )', ', ' + funcs[0] + '], )')
+        if new_effect != effect:
+            edits.append((hook.start, hook.end, new_effect))
             fixes += 1
-            return result
-        return match.group(0)
     
-    new_content = re.sub(pattern, replacer, content, flags=re.DOTALL)
-    return new_content, fixes
+    return replace_spans(content, edits), fixes
 
-def fix_file(file_path: Path) -> int:
-    """Fix a single file"""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        original = content
-        total = 0
-        
-        content, f1 = fix_callback_deps(content)
-        total += f1
-        
-        content, f2 = fix_effect_deps(content)
-        total += f2
-        
-        if content != original:
-            file_path.write_text(content, encoding='utf-8')
-            if total > 0:
-                print(f"✅ {file_path.name}: {total} fixes")
-            return total
-        return 0
-    except Exception as e:
-        print(f"❌ {file_path}: {e}")
-        return 0
+TRANSFORMS = [
+    fix_callback_deps,
+    fix_effect_deps,
+]
 
 def main():
-    web_dir = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app")
-    
-    print("🔧 Fixing Remaining React Hook Warnings")
-    print("=" * 50)
-    
-    total = 0
-    files = 0
-    
-    for tsx in web_dir.rglob("*.tsx"):
-        fixed = fix_file(tsx)
-        if fixed > 0:
-            files += 1
-            total += fixed
-    
-    print(f"\n🎉 Fixed {total} warnings in {files} files")
+    codemod_main(plugins=[Path(__file__).name], title="🔧 Fixing Remaining React Hook Warnings")
 
 if __name__ == "__main__":
     main()
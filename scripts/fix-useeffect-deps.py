@@ -5,79 +5,76 @@ Fix useEffect hook dependencies - add missing load/fetch functions
 import re
 from pathlib import Path
 
+from hook_codemod import main as codemod_main
+from hook_scanner import add_deps, declared_names, has_flat_body, replace_spans, scan_code, split_deps
+
+# load*/fetch* calls, setter calls and `name.` member access (not after a dot)
+LOADER_CALL = re.compile(r'(?<![.\w$])(load\w+|fetch\w+)\s*\(')
+SETTER_CALL = re.compile(r'(?<![.\w$])(set[A-Z]\w+)\s*\(')
+MEMBER_ACCESS = re.compile(r'(?<![.\w$])([a-z]\w+)\s*\.(?!\.)')
+# Effect callback of the form `() => { ... }`
+NO_ARG_ARROW = re.compile(r'\(\s*\)\s*=>\s*\{')
+GLOBALS = {'console', 'window', 'document'}
+
+def _effect_hooks(content: str):
+    """Yield (hook, code) for every `useEffect(() => { ... }, [...])` without nested braces"""
+    hooks, code = scan_code(content, {'useEffect'})
+    for hook in hooks:
+        if has_flat_body(content, hook) and NO_ARG_ARROW.match(code, hook.callback[0]):
+            yield hook, code
+
 def fix_useeffect_with_functions(content: str) -> tuple[str, int]:
     """Fix useEffect hooks that call functions but don't include them in deps"""
     fixes = 0
+    edits = []
     
-    # Pattern: Find useEffect blocks
-    # Match multiline useEffect with empty or incomplete dependency array
-    pattern = r'useEffect\(\s*\(\s*\)\s*=>\s*\{([^}]*)\},\s*\[([^\]]*)\]\s*\)'
-    
-    def replacer(match):
-        nonlocal fixes
-        body = match.group(1)
-        current_deps = match.group(2).strip()
-        
-        # Find all function calls in the effect body
-        func_calls = re.findall(r'\b(load\w+|fetch\w+)\s*\(', body)
-        
-        if not func_calls:
-            return match.group(0)
-        
-        # Parse current dependencies
-        if current_deps:
-            deps_list = [d.strip() for d in current_deps.split(',')]
-        else:
-            deps_list = []
+    for hook, code in _effect_hooks(content):
+        deps_text = content[hook.deps[0]:hook.deps[1]]
+        deps_list = split_deps(deps_text)
         
-        # Add missing function dependencies
-        added = False
-        for func in set(func_calls):
-            if func not in deps_list and func not in current_deps:
-                deps_list.append(func)
-                added = True
+        # Find function calls in the effect body, skipping ones declared inside it
+        local = declared_names(code, hook.body)
+        added = []
+        for func in LOADER_CALL.findall(code, *hook.body):
+            if func not in deps_list and func not in local and func not in added:
+                added.append(func)
         
-        if not added:
-            return match.group(0)
-        
-        # Reconstruct with new dependencies
-        new_deps = ', '.join(deps_list)
-        fixes += 1
-        return match.group(0).replace('[' + current_deps + ']', '[' + new_deps + ']')
+        if added:
+            edits.append((*hook.deps, add_deps(deps_text, added)))
+            fixes += 1
     
-    new_content = re.sub(pattern, replacer, content, flags=re.DOTALL)
-    return new_content, fixes
+    return replace_spans(content, edits), fixes
 
 def fix_useeffect_with_state(content: str) -> tuple[str, int]:
     """Fix useEffect hooks that reference state but don't include in deps"""
     fixes = 0
+    edits = []
     
-    # Pattern for useEffect with state access
-    pattern = r'useEffect\(\s*\(\s*\)\s*=>\s*\{([^}]*)\},\s*\[\s*\]\s*\)'
-    
-    def replacer(match):
-        nonlocal fixes
-        body = match.group(1)
+    for hook, code in _effect_hooks(content):
+        # Only effects with an empty dependency array
+        if content[hook.deps[0]:hook.deps[1]].strip():
+            continue
         
-        # Find state setters being referenced
-        setters = re.findall(r'\b(set[A-Z]\w+)\s*\(', body)
-        
-        # Find regular state variables being referenced (not setters)
-        state_vars = re.findall(r'\b([a-z]\w+)\s*\.', body)
-        state_vars = [v for v in state_vars if v not in ['console', 'window', 'document']]
-        
-        deps_to_add = list(set(setters + state_vars))
+        # State setters and state variables referenced from the component scope
+        local = declared_names(code, hook.body) | GLOBALS
+        deps_to_add = []
+        for pattern in (SETTER_CALL, MEMBER_ACCESS):
+            for name in pattern.findall(code, *hook.body):
+                if name not in local and name not in deps_to_add:
+                    deps_to_add.append(name)
         
         if not deps_to_add:
-            return match.group(0)
+            continue
         
-        # Add dependencies
-        new_deps = ', '.join(deps_to_add)
-        fixes += 1
-        return match.group(0).replace('[], )', '[' + new_deps + '], )')
+        # Only a literal `[], )` inside the effect is rewritten, never its deps
+        # array: member-accessed objects are rarely stable across renders
+        effect = content[hook.start:hook.end]
+        new_effect = effect.replace('[], )', '[' + ', '.join(deps_to_add) + '], )')
+        if new_effect != effect:
+            edits.append((hook.start, hook.end, new_effect))
+            fixes += 1
     
-    new_content = re.sub(pattern, replacer, content, flags=re.DOTALL)
-    return new_content, fixes
+    return replace_spans(content, edits), fixes
 
 def fix_unnecessary_deps(content: str) -> tuple[str, int]:
     """Remove unnecessary dependencies like setTimeout, setError from outer scope"""
@@ -102,50 +99,23 @@ def fix_unnecessary_deps(content: str) -> tuple[str, int]:
     
     return content, fixes
 
-def fix_file(file_path: Path) -> int:
-    """Fix a single file"""
-    try:
-        content = file_path.read_text(encoding='utf-8')
-        original = content
-        total = 0
-        
-        content, f1 = fix_useeffect_with_functions(content)
-        total += f1
-        
-        # Only apply state fix if no function fixes were made
-        if f1 == 0:
-            content, f2 = fix_useeffect_with_state(content)
-            total += f2
-        
-        content, f3 = fix_unnecessary_deps(content)
-        total += f3
-        
-        if content != original:
-            file_path.write_text(content, encoding='utf-8')
-            if total > 0:
-                print(f"✅ {file_path.name}: {total} fixes")
-            return total
-        return 0
-    except Exception as e:
-        print(f"❌ {file_path}: {e}")
-        return 0
-
-def main():
-    web_dir = Path("/Users/julianclarkson/Library/Mobile Documents/com~apple~CloudDocs/Dragonfly26/ATLVS/apps/web/app")
+def fix_useeffect_deps(content: str) -> tuple[str, int]:
+    """Fix useEffect function dependencies, falling back to state dependencies"""
+    content, fixes = fix_useeffect_with_functions(content)
     
-    print("🔧 Fixing useEffect Dependencies")
-    print("=" * 50)
+    # Only apply state fix if no function fixes were made
+    if fixes == 0:
+        content, fixes = fix_useeffect_with_state(content)
     
-    total = 0
-    files = 0
-    
-    for tsx in web_dir.rglob("*.tsx"):
-        fixed = fix_file(tsx)
-        if fixed > 0:
-            files += 1
-            total += fixed
-    
-    print(f"\n🎉 Fixed {total} warnings in {files} files")
+    return content, fixes
+
+TRANSFORMS = [
+    fix_useeffect_deps,
+    fix_unnecessary_deps,
+]
+
+def main():
+    codemod_main(plugins=[Path(__file__).name], title="🔧 Fixing useEffect Dependencies")
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,128 @@
 """
 Generate complete i18n translations for German, Portuguese, and Chinese
 This script creates complete translation files by translating the English base
+
+Usage:
+    python3 scripts/generate-translations.py              # ar, he, ja in one pass
+    python3 scripts/generate-translations.py de pt zh     # any locales in TRANSLATIONS
+    python3 scripts/generate-translations.py --per-language   # reload en.json per locale
+    python3 scripts/generate-translations.py --sync       # only new or changed keys
+    python3 scripts/generate-translations.py --all -j 0   # sync every locale, in parallel
+    python3 scripts/generate-translations.py --sync --split   # plus per-namespace bundles
+    python3 scripts/generate-translations.py --sync --production --intern   # hashed, minified bundles
+    python3 scripts/generate-translations.py --coverage --fail-under 80     # coverage matrix, CI gate
+
+By default en.json is parsed once and walked once, with every locale's file
+written as the walk goes. Strings are translated phrase by phrase: every
+glossary term found at word boundaries is replaced, longest match first, while
+ICU placeholders such as {count} or {n, plural, ...} are copied unchanged.
+
+--sync keeps existing locale values and translates only keys whose English
+text is new or changed since the last sync, as recorded per locale in
+apps/web/.translation-manifest.json. Keys that exist only in a locale file are
+kept; keys removed from en.json are dropped. Files are only rewritten when
+their content changes.
+
+--all syncs every locale in TRANSLATIONS or in messages/; it always implies
+--sync, so existing translations, including those of locales without a
+glossary, are never replaced by English. --jobs N generates locales in a process pool from
+one parsed en.json and reports each locale's time and coverage, the share of
+string leaves that differ from English. --sync reports the same, in one process
+unless --jobs says otherwise.
+
+--split also writes every locale in messages/, en included, to
+messages-namespaced/<locale>/<namespace>.json, grouping top-level keys the
+way scripts/i18n/split-namespaces.ts does (common.json holds common and nav),
+with a manifest.json listing the files every route needs. Routes and their
+namespaces come from the useTranslations/getTranslations calls in
+apps/web/app. Output is sorted and timestamp-free, so unchanged input leaves
+every file untouched; only files a previous run listed are ever removed.
+
+--production also writes every locale in messages/ minified to
+messages-dist/<locale>.<hash>.json, named after its content hash, with a
+manifest.json mapping each locale to its current file; a locale whose content
+is unchanged keeps its filename, and so its CDN URL, across deploys. With
+--intern the bundle is {"values": [...], "messages": {...}}: values that repeat
+(and every number) are stored once in "values" and replaced in "messages" by
+their integer index.
+
+--coverage generates nothing. It flattens en and every locale in messages/
+and messages-enhanced/ into sorted dotted key paths once, then prints a
+locale × namespace matrix of translated keys. Every English key counts as
+translated, untranslated (same text as English), stale (English changed
+since the last --sync), or missing; keys only a locale has count as extra.
+--coverage-json writes the full matrix and --fail-under PCT exits non-zero
+when any messages/ cell falls below PCT.
 """
 
+import argparse
+import bisect
+import hashlib
 import json
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+MESSAGES_DIR = Path(__file__).parent.parent / 'apps' / 'web' / 'messages'
+# Beside messages/, not in it: tools such as scripts/i18n/split-namespaces.ts
+# treat every messages/*.json as a locale
+MANIFEST_PATH = MESSAGES_DIR.parent / '.translation-manifest.json'
+APP_DIR = MESSAGES_DIR.parent / 'app'
+NAMESPACED_DIR = MESSAGES_DIR.parent / 'messages-namespaced'
+DIST_DIR = MESSAGES_DIR.parent / 'messages-dist'
+
+# Locale file layouts indexed by --coverage: <locale>.json, or <locale>/<file>.json
+COVERAGE_SOURCES = {
+    'messages': MESSAGES_DIR,
+    'messages-enhanced': MESSAGES_DIR.parent / 'messages-enhanced',
+}
+COVERAGE_STATUSES = ('translated', 'untranslated', 'stale', 'missing', 'extra')
+
+# Hex digits of the content hash in production filenames
+HASH_LENGTH = 10
+BUNDLE_NAME = re.compile(r'^(.+)\.[0-9a-f]{%d}\.json$' % HASH_LENGTH)
+
+# Namespace files and the top-level keys each holds, as written by
+# scripts/i18n/split-namespaces.ts (NAMESPACE_MAPPINGS): both tools write the
+# same layout, and packages/i18n/src/request-namespaced.ts loads common.json
+NAMESPACE_BUNDLES = {
+    'common': ('common', 'nav'),
+    'projects': ('projects',),
+    'people': ('people',),
+    'programming': ('programming',),
+    'pipeline': ('pipeline',),
+    'procurement': ('procurement',),
+    'jobs': ('jobs',),
+    'companies': ('companies',),
+    'finance': ('finance',),
+    'analytics': ('analytics',),
+    'assets': ('assets',),
+    'files': ('files',),
+    'settings': ('settings',),
+    'profile': ('profile',),
+    'auth': ('auth', 'onboarding'),
+    'marketplace': ('marketplace', 'opendeck'),
+}
+BUNDLE_OF = {key: bundle for bundle, keys in NAMESPACE_BUNDLES.items() for key in keys}
+
+# Namespace file every route loads up front
+SHARED_BUNDLE = 'common'
+
+# Marks the manifest.json files this script writes; any other is left alone
+GENERATOR = 'scripts/generate-translations.py'
+
+# Namespace argument of next-intl's useTranslations('ns') / getTranslations({namespace: 'ns'})
+TRANSLATIONS_CALL = re.compile(r"""\b(?:useTranslations|getTranslations)\(\s*(?:\{\s*namespace:\s*)?['"]([^'"]+)['"]""")
+
+# Stands in for a key the locale file does not have
+MISSING = object()
+
+# Matches json.dump(..., indent=2) so both modes write identical files
+INDENT = '  '
 
 # Translation dictionaries for common terms
 TRANSLATIONS = {
@@ -152,15 +269,144 @@ TRANSLATIONS = {
 
 def load_english():
     """Load the English base file"""
-    en_path = Path(__file__).parent.parent / 'apps' / 'web' / 'messages' / 'en.json'
+    en_path = MESSAGES_DIR / 'en.json'
     with open(en_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+class PhraseTranslator:
+    """
+    Glossary compiled into an Aho-Corasick automaton, so one scan of a string
+    finds every glossary term in it however large the glossary grows. Matches
+    must sit on word boundaries; overlapping ones resolve leftmost-longest,
+    so "Save Project" wins over "Save" when both are terms. Text inside ICU
+    placeholders is never matched. Results are memoized per string.
+    """
+
+    def __init__(self, glossary: Dict[str, str]):
+        self.glossary = glossary
+        # State 0 is the root; each state's outputs are the lengths of the
+        # terms ending there, its own and those reached by failure links
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+        for term in glossary:
+            if term:
+                self._add(term)
+        self._link()
+        self._cache: Dict[str, str] = {}
+
+    def _add(self, term: str):
+        state = 0
+        for char in term:
+            following = self.goto[state].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[state][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = following
+        self.outputs[state].append(len(term))
+
+    def _link(self):
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, following in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[following] = target if target != following else 0
+                self.outputs[following] = self.outputs[following] + self.outputs[self.fail[following]]
+                queue.append(following)
+
+    def _matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start, end) of every glossary term occurrence in text"""
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for length in self.outputs[state]:
+                yield i + 1 - length, i + 1
+
+    def _translate_literal(self, text: str) -> str:
+        longest: Dict[int, int] = {}
+        for start, end in self._matches(text):
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum():
+                continue
+            if end > longest.get(start, -1):
+                longest[start] = end
+        if not longest:
+            return text
+        parts = []
+        position = 0
+        for start in sorted(longest):
+            if start < position:
+                continue
+            end = longest[start]
+            parts.append(text[position:start])
+            parts.append(self.glossary[text[start:end]])
+            position = end
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    def translate(self, text: str) -> str:
+        translated = self._cache.get(text)
+        if translated is None:
+            exact = self.glossary.get(text)
+            if exact is not None:
+                translated = exact
+            else:
+                translated = ''.join(
+                    segment if is_placeholder else self._translate_literal(segment)
+                    for segment, is_placeholder in split_placeholders(text)
+                )
+            self._cache[text] = translated
+        return translated
+
+def split_placeholders(text: str) -> Iterator[Tuple[str, bool]]:
+    """
+    (segment, is_placeholder) pieces of an ICU message. Placeholders are
+    top-level {...} groups, nested braces included; an unbalanced '{' leaves
+    the rest of the text as a placeholder so it is not touched.
+    """
+    position = 0
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char == '{':
+            if depth == 0:
+                if i > position:
+                    yield text[position:i], False
+                start = i
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1], True
+                position = i + 1
+    if depth:
+        yield text[start:], True
+    elif position < len(text):
+        yield text[position:], False
+
+_translators: Dict[str, PhraseTranslator] = {}
+
+def translator_for(lang: str) -> PhraseTranslator:
+    """The compiled glossary for a language, built on first use"""
+    translator = _translators.get(lang)
+    if translator is None:
+        translator = _translators[lang] = PhraseTranslator(TRANSLATIONS.get(lang, {}))
+    return translator
+
 def translate_value(value, lang):
     """Translate a single value"""
     if isinstance(value, str):
-        # Use dictionary if available, otherwise return original
-        return TRANSLATIONS[lang].get(value, value)
+        # Glossary phrases are replaced; anything else stays in English
+        return translator_for(lang).translate(value)
     return value
 
 def translate_dict(data, lang):
@@ -179,19 +425,767 @@ def generate_translation(lang):
     en_data = load_english()
     translated = translate_dict(en_data, lang)
     
-    output_path = Path(__file__).parent.parent / 'apps' / 'web' / 'messages' / f'{lang}.json'
+    output_path = MESSAGES_DIR / f'{lang}.json'
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(translated, f, ensure_ascii=False, indent=2)
     
     print(f"✅ {lang}.json created successfully")
 
-if __name__ == '__main__':
-    languages = ['ar', 'he', 'ja']
+def write_translated(node, outputs: List[Tuple[str, IO[str]]], depth: int = 0):
+    """
+    Write one node of the English tree to every locale's output at once.
+    Structure is written once per locale; only string leaves are translated
+    per locale. Output matches json.dump(..., ensure_ascii=False, indent=2).
+    """
+    if isinstance(node, (dict, list)) and node:
+        is_dict = isinstance(node, dict)
+        inner = '\n' + INDENT * (depth + 1)
+        opening, closing = ('{', '}') if is_dict else ('[', ']')
+        for _, out in outputs:
+            out.write(opening)
+        items = node.items() if is_dict else ((None, item) for item in node)
+        for i, (key, value) in enumerate(items):
+            prefix = (',' if i else '') + inner
+            if is_dict:
+                prefix += json.dumps(key, ensure_ascii=False) + ': '
+            for _, out in outputs:
+                out.write(prefix)
+            write_translated(value, outputs, depth + 1)
+        closing = '\n' + INDENT * depth + closing
+        for _, out in outputs:
+            out.write(closing)
+    elif isinstance(node, str):
+        for lang, out in outputs:
+            out.write(json.dumps(translate_value(node, lang), ensure_ascii=False))
+    else:
+        text = json.dumps(node, ensure_ascii=False)
+        for _, out in outputs:
+            out.write(text)
+
+def generate_translations(languages: Sequence[str]):
+    """
+    Generate every language from one parse and one walk of en.json. Each file
+    is written to a temporary path as the walk goes and renamed into place
+    once complete, so a failed run leaves the existing files untouched.
+    """
+    print(f"Generating {', '.join(languages)} translations in one pass...")
+    en_data = load_english()
+    outputs = []
+    try:
+        for lang in languages:
+            tmp_path = MESSAGES_DIR / f'{lang}.json.tmp'
+            outputs.append((lang, open(tmp_path, 'w', encoding='utf-8')))
+        write_translated(en_data, outputs)
+    finally:
+        for _, out in outputs:
+            out.close()
+    
+    for lang, _ in outputs:
+        os.replace(MESSAGES_DIR / f'{lang}.json.tmp', MESSAGES_DIR / f'{lang}.json')
+        print(f"✅ {lang}.json created successfully")
+
+def message_hash(value) -> str:
+    """Short digest of an English message, compared across syncs"""
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+def key_path(prefix: str, key: str) -> str:
+    return f"{prefix}.{key}" if prefix else key
+
+def load_manifest() -> Dict[str, Dict[str, str]]:
+    """Per locale, dotted key -> hash of the English text its value was synced from"""
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f).get('locales', {})
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(locales: Dict[str, Dict[str, str]]):
+    text = json.dumps({'version': 1, 'locales': locales}, ensure_ascii=False, indent=2, sort_keys=True) + '\n'
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+class LocaleSync:
+    """
+    Merges en.json into one locale's existing messages. A leaf is translated
+    when the locale lacks it or its English hash differs from the manifest;
+    otherwise the locale's value stays. Leaves with no manifest entry yet are
+    adopted as they are, so a first sync keeps every existing translation.
+    """
+
+    def __init__(self, lang: str, old_hashes: Dict[str, str]):
+        self.lang = lang
+        self.old_hashes = old_hashes
+        self.hashes: Dict[str, str] = {}
+        # Every synced key and its ancestors: locale-only keys outside this set are kept
+        self.synced_paths: Set[str] = set()
+        for key in old_hashes:
+            parts = key.split('.')
+            for i in range(1, len(parts) + 1):
+                self.synced_paths.add('.'.join(parts[:i]))
+        self.translated = 0
+        self.kept = 0
+        self.removed = 0
+
+    def merge(self, en_node, existing, prefix: str = ''):
+        if isinstance(en_node, dict):
+            existing_dict = existing if isinstance(existing, dict) else {}
+            # The locale's own key order is kept; keys new to it follow in en.json order
+            merged = {}
+            for key, value in existing_dict.items():
+                if key in en_node:
+                    merged[key] = self.merge(en_node[key], value, key_path(prefix, key))
+                elif key_path(prefix, key) in self.synced_paths:
+                    # Synced before and gone from en.json
+                    self.removed += 1
+                else:
+                    merged[key] = value
+            for key, value in en_node.items():
+                if key not in merged:
+                    merged[key] = self.merge(value, MISSING, key_path(prefix, key))
+            return merged
+        
+        path = prefix
+        digest = self.hashes[path] = message_hash(en_node)
+        if existing is not MISSING and not isinstance(existing, dict):
+            previous = self.old_hashes.get(path)
+            if previous is None or previous == digest:
+                self.kept += 1
+                return existing
+        self.translated += 1
+        return translate_dict(en_node, self.lang)
+
+def sync_locale(en_data, lang: str, old_hashes: Dict[str, str]) -> Tuple[LocaleSync, object, bool]:
+    """Merge en.json into one locale file; returns the sync, the merged tree and whether the file was written"""
+    path = MESSAGES_DIR / f'{lang}.json'
+    try:
+        old_text = path.read_text(encoding='utf-8')
+        existing = json.loads(old_text)
+    except (OSError, ValueError):
+        old_text, existing = None, MISSING
+    
+    sync = LocaleSync(lang, old_hashes)
+    merged = sync.merge(en_data, existing)
+    text = json.dumps(merged, ensure_ascii=False, indent=2)
+    if old_text is not None and old_text.endswith('\n'):
+        text += '\n'
+    if text == old_text:
+        return sync, merged, False
+    tmp_path = MESSAGES_DIR / f'{lang}.json.tmp'
+    tmp_path.write_text(text, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return sync, merged, True
+
+def discover_locales() -> List[str]:
+    """Every locale with a glossary or a messages file, English excluded"""
+    files = {path.stem for path in MESSAGES_DIR.glob('*.json') if not path.name.startswith('.')}
+    return sorted((set(TRANSLATIONS) | files) - {'en'})
+
+def locale_files() -> List[str]:
+    """en plus every other locale that has a file in messages/"""
+    return ['en'] + [lang for lang in discover_locales() if (MESSAGES_DIR / f'{lang}.json').exists()]
+
+def leaf_coverage(en_node, localized) -> Tuple[int, int]:
+    """(string leaves in en_node, how many of them the localized tree has in another wording)"""
+    if isinstance(en_node, dict):
+        localized = localized if isinstance(localized, dict) else {}
+        totals = [leaf_coverage(value, localized.get(key, MISSING)) for key, value in en_node.items()]
+        return sum(t[0] for t in totals), sum(t[1] for t in totals)
+    if isinstance(en_node, list):
+        localized = localized if isinstance(localized, list) else []
+        totals = [leaf_coverage(value, localized[i] if i < len(localized) else MISSING)
+                  for i, value in enumerate(en_node)]
+        return sum(t[0] for t in totals), sum(t[1] for t in totals)
+    if isinstance(en_node, str):
+        return 1, int(isinstance(localized, str) and localized != en_node)
+    return 0, 0
+
+# en.json as parsed once by the parent, handed to each pool worker on start-up
+_en_data = None
+
+def _init_worker(en_data):
+    global _en_data
+    _en_data = en_data
+
+def generate_locale(lang: str, sync: bool, old_hashes: Dict[str, str]) -> Dict:
+    """Generate or sync one locale from the shared en.json, in a pool worker or in process"""
+    started = time.perf_counter()
+    if sync:
+        locale_sync, localized, written = sync_locale(_en_data, lang, old_hashes)
+        hashes = locale_sync.hashes
+    else:
+        tmp_path = MESSAGES_DIR / f'{lang}.json.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            write_translated(_en_data, [(lang, out)])
+        os.replace(tmp_path, MESSAGES_DIR / f'{lang}.json')
+        localized, written, hashes = translate_dict(_en_data, lang), True, None
+    leaves, translated = leaf_coverage(_en_data, localized)
+    return {
+        'lang': lang,
+        'seconds': time.perf_counter() - started,
+        'leaves': leaves,
+        'translated': translated,
+        'written': written,
+        'hashes': hashes,
+    }
+
+def generate_locales(languages: Sequence[str], sync: bool, jobs: int) -> List[Dict]:
+    """Generate locales, one task per locale (in process when jobs <= 1), and print time and coverage for each"""
+    en_data = load_english()
+    manifest = load_manifest() if sync else {}
+    if not sync:
+        skipped = [lang for lang in languages if lang not in TRANSLATIONS]
+        if skipped:
+            print(f"⚠️  Skipping {', '.join(skipped)}: no glossary (use --sync to merge new keys)")
+        languages = [lang for lang in languages if lang in TRANSLATIONS]
+    
+    started = time.perf_counter()
+    if jobs > 1:
+        print(f"Generating {len(languages)} locales with {jobs} workers...")
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(en_data,)) as executor:
+            futures = [executor.submit(generate_locale, lang, sync, manifest.get(lang, {})) for lang in languages]
+            reports = [future.result() for future in as_completed(futures)]
+    else:
+        print(f"Generating {len(languages)} locales...")
+        _init_worker(en_data)
+        reports = [generate_locale(lang, sync, manifest.get(lang, {})) for lang in languages]
+    
+    reports.sort(key=lambda r: r['lang'])
+    for report in reports:
+        share = report['translated'] / report['leaves'] * 100 if report['leaves'] else 0.0
+        state = 'written' if report['written'] else 'unchanged'
+        print(f"  {report['lang']:<4} {report['seconds'] * 1000:7.1f} ms  "
+              f"coverage {report['translated']}/{report['leaves']} ({share:.1f}%)  {state}")
+    print(f"⏱️  {len(reports)} locales in {time.perf_counter() - started:.2f}s")
+    
+    if sync:
+        changed = False
+        for report in reports:
+            if manifest.get(report['lang']) != report['hashes']:
+                manifest[report['lang']] = report['hashes']
+                changed = True
+        if changed:
+            save_manifest(manifest)
+    return reports
+
+def route_url(page_dir: Path) -> str:
+    """URL of a page directory under app/, with route groups like '(shell)' removed"""
+    segments = page_dir.relative_to(APP_DIR).parts
+    return '/' + '/'.join(s for s in segments if not (s.startswith('(') and s.endswith(')')))
+
+def route_namespaces() -> Dict[str, Set[str]]:
+    """
+    Top-level namespaces each route uses. A source file counts toward the
+    route of the nearest page.tsx at or above its directory.
+    """
+    usage: Dict[Path, Set[str]] = {}
+    page_dirs: Set[Path] = set()
+    for directory, dirnames, filenames in os.walk(APP_DIR):
+        dirnames[:] = sorted(d for d in dirnames if d != 'node_modules')
+        directory = Path(directory)
+        if 'page.tsx' in filenames:
+            page_dirs.add(directory)
+        for name in filenames:
+            if not name.endswith(('.ts', '.tsx')):
+                continue
+            try:
+                content = (directory / name).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            namespaces = {match.split('.', 1)[0] for match in TRANSLATIONS_CALL.findall(content)}
+            if namespaces:
+                usage.setdefault(directory, set()).update(namespaces)
+    
+    routes: Dict[str, Set[str]] = {}
+    for directory, namespaces in usage.items():
+        page_dir = directory
+        while page_dir not in page_dirs and page_dir != APP_DIR:
+            page_dir = page_dir.parent
+        if page_dir in page_dirs:
+            routes.setdefault(route_url(page_dir), set()).update(namespaces)
+    return routes
+
+def write_if_changed(path: Path, text: str) -> bool:
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return True
+
+def read_output_manifest(output_dir: Path) -> Dict:
+    """
+    manifest.json this script left in output_dir, or {} if there is none.
+    Raises ValueError if the directory holds a manifest.json written by
+    something else, so it is never overwritten.
+    """
+    path = output_dir / 'manifest.json'
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        manifest = None
+    if not isinstance(manifest, dict) or manifest.get('generator') != GENERATOR:
+        raise ValueError(f"{path} was not written by this script; refusing to overwrite it")
+    return manifest
+
+def namespace_bundles(messages: Dict) -> Dict[str, Dict]:
+    """
+    Top-level keys grouped into namespace files as NAMESPACE_BUNDLES lists them;
+    a key with no mapping gets a file of its own
+    """
+    bundles = {}
+    for bundle, keys in NAMESPACE_BUNDLES.items():
+        content = {key: messages[key] for key in keys if key in messages}
+        if content:
+            bundles[bundle] = content
+    for key, value in messages.items():
+        if key not in BUNDLE_OF:
+            bundles[key] = {key: value}
+    return bundles
+
+def split_namespaces(output_dir: Path = NAMESPACED_DIR):
+    """
+    Write every locale in messages/ as namespace files plus a route manifest.
+    Files keep their keys ({"nav": {...}}) so messages merged from several of
+    them look the same as the monolithic file. The manifest always covers
+    every locale, whichever ones this run generated. Only files listed in the
+    previous manifest are ever removed.
+    """
+    previous = read_output_manifest(output_dir)
+    old_files: Dict[str, List[str]] = previous.get('files', {})
+    languages = locale_files()
+    print(f"Splitting {', '.join(languages)} into namespaces under {output_dir}...")
+    all_bundles: Set[str] = set()
+    files: Dict[str, List[str]] = {}
+    written = 0
     for lang in languages:
+        with open(MESSAGES_DIR / f'{lang}.json', 'r', encoding='utf-8') as f:
+            messages = json.load(f)
+        locale_dir = output_dir / lang
+        bundles = namespace_bundles(messages)
+        for bundle, content in bundles.items():
+            text = json.dumps(content, ensure_ascii=False, indent=2) + '\n'
+            written += write_if_changed(locale_dir / f'{bundle}.json', text)
+        all_bundles.update(bundles)
+        files[lang] = sorted(f'{bundle}.json' for bundle in bundles)
+    
+    # Files gone from a locale, and every file of locales gone from messages/
+    for lang, names in old_files.items():
+        locale_dir = output_dir / lang
+        for name in set(names) - set(files.get(lang, ())):
+            stale = locale_dir / name
+            if stale.exists():
+                stale.unlink()
+                written += 1
+        if lang not in files and locale_dir.is_dir() and not any(locale_dir.iterdir()):
+            locale_dir.rmdir()
+    
+    routes = {}
+    for route, namespaces in sorted(route_namespaces().items()):
+        needed = {BUNDLE_OF.get(namespace, namespace) for namespace in namespaces}
+        routes[route] = [SHARED_BUNDLE] + sorted((needed & all_bundles) - {SHARED_BUNDLE})
+    manifest = {
+        'generator': GENERATOR,
+        'version': 2,
+        'locales': sorted(languages),
+        'namespaces': sorted(all_bundles),
+        'shared': [SHARED_BUNDLE],
+        'files': files,
+        'routes': routes,
+    }
+    written += write_if_changed(output_dir / 'manifest.json',
+                                json.dumps(manifest, ensure_ascii=False, indent=2) + '\n')
+    print(f"✅ {len(all_bundles)} namespace files, {len(routes)} routes, {written} files changed")
+
+def minify(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def intern_values(messages) -> Dict:
+    """
+    Bundle with repeated values stored once. Strings seen more than once, and
+    all numbers so that integer leaves are unambiguous, move to "values" in
+    order of first appearance; "messages" holds their indexes instead.
+    """
+    counts: Dict[str, int] = {}
+    
+    def count(node):
+        if isinstance(node, dict):
+            for value in node.values():
+                count(value)
+        elif isinstance(node, list):
+            for value in node:
+                count(value)
+        elif isinstance(node, str):
+            counts[node] = counts.get(node, 0) + 1
+    
+    count(messages)
+    values: List = []
+    index: Dict[Tuple[type, object], int] = {}
+    
+    def encode(node):
+        if isinstance(node, dict):
+            return {key: encode(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [encode(value) for value in node]
+        if isinstance(node, str) and counts[node] < 2:
+            return node
+        if isinstance(node, (str, int, float)) and not isinstance(node, bool):
+            key = (type(node), node)
+            position = index.get(key)
+            if position is None:
+                position = index[key] = len(values)
+                values.append(node)
+            return position
+        return node
+    
+    encoded = encode(messages)
+    return {'values': values, 'messages': encoded}
+
+def decode_interned(bundle: Dict):
+    """Messages back from an intern_values bundle"""
+    values = bundle['values']
+    
+    def decode(node):
+        if isinstance(node, dict):
+            return {key: decode(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [decode(value) for value in node]
+        if isinstance(node, int) and not isinstance(node, bool):
+            return values[node]
+        return node
+    
+    return decode(bundle['messages'])
+
+def write_production(output_dir: Path = DIST_DIR, intern: bool = False):
+    """
+    Minified, content-hashed bundles of every locale in messages/ plus a
+    manifest; <locale>.<hash>.json bundles no manifest entry points to are
+    removed. A manifest.json written by something else is never overwritten.
+    """
+    previous = read_output_manifest(output_dir)
+    languages = locale_files()
+    print(f"Writing production bundles for {', '.join(languages)} to {output_dir}...")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    locales = {}
+    pretty_total = bundle_total = new_files = 0
+    for lang in sorted(languages):
+        source = MESSAGES_DIR / f'{lang}.json'
+        with open(source, 'r', encoding='utf-8') as f:
+            messages = json.load(f)
+        payload = minify(intern_values(messages) if intern else messages).encode('utf-8')
+        digest = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+        name = f'{lang}.{digest}.json'
+        path = output_dir / name
+        if not path.exists():
+            path.write_bytes(payload)
+            new_files += 1
+        locales[lang] = {'file': name, 'hash': digest, 'bytes': len(payload)}
+        pretty_total += source.stat().st_size
+        bundle_total += len(payload)
+    
+    # Superseded bundles, and those of locales gone from messages/: only
+    # <locale>.<hash>.json files of known locales or the previous manifest
+    current = {entry['file'] for entry in locales.values()}
+    known = set(languages) | set(previous.get('locales', {}))
+    for stale in output_dir.glob('*.json'):
+        match = BUNDLE_NAME.match(stale.name)
+        if stale.name not in current and match and match.group(1) in known:
+            stale.unlink()
+    
+    manifest = {'generator': GENERATOR, 'version': 1, 'format': 'interned' if intern else 'plain', 'locales': locales}
+    write_if_changed(output_dir / 'manifest.json', json.dumps(manifest, ensure_ascii=False, indent=2) + '\n')
+    saved = (1 - bundle_total / pretty_total) * 100 if pretty_total else 0.0
+    print(f"✅ {len(locales)} bundles, {new_files} new filenames; "
+          f"{pretty_total / 1024:.1f}KB → {bundle_total / 1024:.1f}KB ({saved:.1f}% smaller)")
+
+def flatten_messages(data, prefix: str = '') -> Iterator[Tuple[str, object]]:
+    """(dotted key path, leaf value) for every leaf, walked like translate_dict"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten_messages(value, key_path(prefix, key))
+    elif isinstance(data, list):
+        for i, item in enumerate(data):
+            yield from flatten_messages(item, key_path(prefix, str(i)))
+    else:
+        yield prefix, data
+
+def namespace_of(path: str) -> str:
+    return path.split('.', 1)[0]
+
+class FlatLocale:
+    """One locale's messages as parallel sorted arrays of key paths and values"""
+
+    def __init__(self, leaves: Iterable[Tuple[str, object]]):
+        pairs = sorted(dict(leaves).items())
+        self.keys = [key for key, _ in pairs]
+        self.values = [value for _, value in pairs]
+
+    def get(self, path: str, default=MISSING):
+        i = bisect.bisect_left(self.keys, path)
+        if i < len(self.keys) and self.keys[i] == path:
+            return self.values[i]
+        return default
+
+    def namespace_range(self, namespace: str) -> Tuple[int, int]:
+        """Index range of the keys under a namespace; '/' sorts right after '.'"""
+        return (bisect.bisect_left(self.keys, namespace + '.'),
+                bisect.bisect_left(self.keys, namespace + '/'))
+
+class TranslationIndex:
+    """
+    Every locale of every coverage source, flattened once. Each key's status
+    against en is classified in one merge of the two sorted key lists; the
+    per-namespace counts that result make coverage queries dict lookups.
+    """
+
+    def __init__(self, sources: Dict[str, Path] = None):
+        self.locales: Dict[Tuple[str, str], FlatLocale] = {}
+        self.statuses: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self.counts: Dict[Tuple[str, str], Dict[str, Dict[str, int]]] = {}
+        manifest = load_manifest()
+        for source, directory in (sources or COVERAGE_SOURCES).items():
+            for lang, data in self._load(directory):
+                self.locales[source, lang] = FlatLocale(flatten_messages(data))
+        for (source, lang), flat in self.locales.items():
+            english = self.locales.get((source, 'en'))
+            if lang != 'en' and english is not None:
+                hashes = manifest.get(lang, {}) if source == 'messages' else {}
+                self._classify(source, lang, english, flat, hashes)
+
+    @staticmethod
+    def _load(directory: Path) -> Iterator[Tuple[str, Dict]]:
+        if not directory.is_dir():
+            return
+        for path in sorted(directory.iterdir()):
+            if path.name.startswith('.'):
+                continue
+            if path.is_file() and path.suffix == '.json':
+                with open(path, 'r', encoding='utf-8') as f:
+                    yield path.stem, json.load(f)
+            elif path.is_dir():
+                merged = {}
+                for part in sorted(path.glob('*.json')):
+                    with open(part, 'r', encoding='utf-8') as f:
+                        merged.update(json.load(f))
+                yield path.name, merged
+
+    def _classify(self, source: str, lang: str, english: FlatLocale, flat: FlatLocale, hashes: Dict[str, str]):
+        statuses: Dict[str, str] = {}
+        i = j = 0
+        en_keys, keys = english.keys, flat.keys
+        while i < len(en_keys) or j < len(keys):
+            if j == len(keys) or (i < len(en_keys) and en_keys[i] < keys[j]):
+                statuses[en_keys[i]] = 'missing'
+                i += 1
+            elif i == len(en_keys) or keys[j] < en_keys[i]:
+                statuses[keys[j]] = 'extra'
+                j += 1
+            else:
+                path, en_value, value = en_keys[i], english.values[i], flat.values[j]
+                synced = hashes.get(path)
+                if synced is not None and synced != message_hash(en_value):
+                    statuses[path] = 'stale'
+                elif isinstance(en_value, str) and value == en_value:
+                    statuses[path] = 'untranslated'
+                else:
+                    statuses[path] = 'translated'
+                i += 1
+                j += 1
+        counts: Dict[str, Dict[str, int]] = {}
+        for path, status in statuses.items():
+            namespace = counts.setdefault(namespace_of(path), dict.fromkeys(COVERAGE_STATUSES, 0))
+            namespace[status] += 1
+        self.statuses[source, lang] = statuses
+        self.counts[source, lang] = counts
+
+    def languages(self, source: str) -> List[str]:
+        return sorted(lang for s, lang in self.statuses if s == source)
+
+    def namespaces(self, source: str) -> List[str]:
+        english = self.locales.get((source, 'en'))
+        return sorted({namespace_of(key) for key in english.keys}) if english else []
+
+    def coverage(self, source: str, lang: str, namespace: Optional[str] = None) -> Dict:
+        """Status counts for a locale, one namespace or all, with the translated share of en keys"""
+        counts = self.counts[source, lang]
+        if namespace is None:
+            totals = dict.fromkeys(COVERAGE_STATUSES, 0)
+            for namespace_counts in counts.values():
+                for status, n in namespace_counts.items():
+                    totals[status] += n
+        else:
+            totals = dict(counts.get(namespace, dict.fromkeys(COVERAGE_STATUSES, 0)))
+        english = sum(totals[status] for status in COVERAGE_STATUSES if status != 'extra')
+        totals['english'] = english
+        totals['coverage'] = round(totals['translated'] / english * 100, 1) if english else None
+        return totals
+
+    def keys(self, source: str, lang: str, status: str, namespace: Optional[str] = None) -> List[str]:
+        """Key paths of a locale with the given status, optionally within one namespace"""
+        statuses = self.statuses[source, lang]
+        if namespace is None:
+            return sorted(path for path, s in statuses.items() if s == status)
+        # en holds every key but extras; the locale holds every extra
+        flat = self.locales[source, 'en' if status != 'extra' else lang]
+        start, end = flat.namespace_range(namespace)
+        return [path for path in flat.keys[start:end] if statuses.get(path) == status]
+
+    def matrix(self) -> Dict:
+        """Per source, per locale: overall and per-namespace coverage"""
+        matrix = {}
+        for source in sorted({s for s, _ in self.locales}):
+            matrix[source] = {
+                'namespaces': self.namespaces(source),
+                'locales': {
+                    lang: {
+                        'overall': self.coverage(source, lang),
+                        'namespaces': {namespace: self.coverage(source, lang, namespace)
+                                       for namespace in self.namespaces(source)},
+                    }
+                    for lang in self.languages(source)
+                },
+            }
+        return matrix
+
+def print_coverage(index: TranslationIndex, languages: Optional[Sequence[str]] = None):
+    """Locale × namespace table of translated percentages, per source"""
+    for source, table in index.matrix().items():
+        namespaces = table['namespaces']
+        rows = [lang for lang in table['locales'] if not languages or lang in languages]
+        print(f"\n📊 {source}: {len(rows)} locales × {len(namespaces)} namespaces")
+        if not rows:
+            print("   (no locales besides en)")
+            continue
+        width = max(6, *(len(n) for n in namespaces))
+        print("   " + "locale  overall  " + "  ".join(n.rjust(width) for n in namespaces))
+        for lang in rows:
+            cells = table['locales'][lang]
+            overall = cells['overall']
+            line = f"   {lang:<6}  {overall['coverage'] or 0:6.1f}%  "
+            line += "  ".join(
+                (f"{cells['namespaces'][n]['coverage']:.1f}%" if cells['namespaces'][n]['coverage'] is not None else '-').rjust(width)
+                for n in namespaces
+            )
+            print(line)
+            print(f"           missing {overall['missing']}, untranslated {overall['untranslated']}, "
+                  f"stale {overall['stale']}, extra {overall['extra']}")
+
+def coverage_failures(index: TranslationIndex, threshold: float, languages: Optional[Sequence[str]] = None) -> List[str]:
+    """messages/ cells below threshold percent, as 'locale/namespace: pct' lines"""
+    failures = []
+    table = index.matrix().get('messages', {'locales': {}})
+    for lang, cells in table['locales'].items():
+        if languages and lang not in languages:
+            continue
+        for namespace, counts in cells['namespaces'].items():
+            if counts['coverage'] is not None and counts['coverage'] < threshold:
+                failures.append(f"{lang}/{namespace}: {counts['coverage']:.1f}%")
+    return failures
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate locale files from apps/web/messages/en.json")
+    parser.add_argument('languages', nargs='*',
+                        help='locales to generate, each a key of TRANSLATIONS (default: ar he ja)')
+    parser.add_argument('--per-language', action='store_true',
+                        help='reload and rebuild en.json separately for each locale')
+    parser.add_argument('--sync', action='store_true',
+                        help='keep existing values; translate only new or changed keys')
+    parser.add_argument('--all', action='store_true',
+                        help='sync every locale in TRANSLATIONS or messages/ instead of the listed ones (implies --sync)')
+    parser.add_argument('--jobs', '-j', type=int,
+                        help='generate locales in this many processes, with timing and coverage; 0 uses every CPU '
+                             '(default: one pass over en.json without the report, or one process with --sync)')
+    parser.add_argument('--split', nargs='?', type=Path, const=NAMESPACED_DIR,
+                        help='also write per-namespace bundles and a route manifest (default: apps/web/messages-namespaced)')
+    parser.add_argument('--production', nargs='?', type=Path, const=DIST_DIR,
+                        help='also write minified, content-hashed bundles and a manifest (default: apps/web/messages-dist)')
+    parser.add_argument('--intern', action='store_true',
+                        help='with --production, store repeated values once in a shared table')
+    parser.add_argument('--coverage', action='store_true',
+                        help='report per-locale, per-namespace translation coverage instead of generating')
+    parser.add_argument('--coverage-json', type=Path,
+                        help='with --coverage, also write the coverage matrix as JSON')
+    parser.add_argument('--fail-under', type=float,
+                        help='with --coverage, exit 1 if any messages/ locale namespace is below this percent')
+    args = parser.parse_args()
+    if args.coverage:
+        # Report rows for the listed locales, or for every locale found
+        return args
+    if not args.languages:
+        args.languages = ['ar', 'he', 'ja']
+    if args.all:
+        # A full regeneration would overwrite hand-translated locales with glossary output
+        args.sync = True
+        args.languages = discover_locales()
+    else:
+        unknown = [lang for lang in args.languages if lang not in TRANSLATIONS]
+        if unknown:
+            parser.error(f"no translations for: {', '.join(unknown)}")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    elif args.jobs is None and args.sync:
+        # Syncing goes locale by locale anyway, so report each one
+        args.jobs = 1
+    return args
+
+def run_coverage(args):
+    started = time.perf_counter()
+    index = TranslationIndex()
+    print(f"Indexed {len(index.locales)} locale files in {(time.perf_counter() - started) * 1000:.1f} ms")
+    print_coverage(index, args.languages)
+    if args.coverage_json:
+        args.coverage_json.write_text(json.dumps(index.matrix(), ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+        print(f"\n📄 Coverage matrix saved to: {args.coverage_json}")
+    if args.fail_under is not None:
+        failures = coverage_failures(index, args.fail_under, args.languages)
+        if failures:
+            print(f"\n❌ {len(failures)} locale namespaces below {args.fail_under:g}%:")
+            for line in failures:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"\n✅ Every locale namespace is at or above {args.fail_under:g}%")
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.coverage:
+        run_coverage(args)
+        sys.exit(0)
+    if args.jobs is not None:
+        try:
+            generate_locales(args.languages, args.sync, args.jobs)
+        except Exception as e:
+            print(f"❌ Error generating {', '.join(args.languages)}: {e}")
+            sys.exit(1)
+    elif args.per_language:
+        for lang in args.languages:
+            try:
+                generate_translation(lang)
+            except Exception as e:
+                print(f"❌ Error generating {lang}: {e}")
+                sys.exit(1)
+    else:
+        try:
+            generate_translations(args.languages)
+        except Exception as e:
+            print(f"❌ Error generating {', '.join(args.languages)}: {e}")
+            sys.exit(1)
+    
+    # Both outputs cover every locale file, not only the ones generated above
+    if args.split:
+        try:
+            split_namespaces(args.split)
+        except Exception as e:
+            print(f"❌ Error splitting namespaces: {e}")
+            sys.exit(1)
+    if args.production:
         try:
-            generate_translation(lang)
+            write_production(args.production, args.intern)
         except Exception as e:
-            print(f"❌ Error generating {lang}: {e}")
+            print(f"❌ Error writing production bundles: {e}")
             sys.exit(1)
     
     print("\n✅ All translations generated successfully!")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Single-pass engine for the React Hook codemod scripts.
+
+Walks apps/web/app once, reads each TSX file once and runs every registered
+transform as a pipeline over the in-memory text, writing only files that
+changed. Each fixer script is a plugin that exports a TRANSFORMS list of
+`(content) -> (content, fixes)` functions.
+
+Usage:
+    python3 scripts/hook_codemod.py                          # all plugins
+    python3 scripts/hook_codemod.py fix-remaining-hooks.py   # selected plugins
+    python3 scripts/hook_codemod.py --jobs 16                # process pool
+    python3 scripts/hook_codemod.py --no-cache               # re-check every file
+
+Files that came out of the pipeline unchanged are recorded in .cache/hook-codemod/
+by size, mtime and content hash, and skipped on later runs until they or any
+transform source changes.
+"""
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+WEB_APP_DIR = SCRIPTS_DIR.parent / 'apps' / 'web' / 'app'
+CACHE_DIR = SCRIPTS_DIR.parent / '.cache' / 'hook-codemod'
+
+# Plugin scripts in pipeline order
+PLUGINS = [
+    'comprehensive-hook-fix.py',
+    'fix-hook-deps.py',
+    'fix-remaining-hooks.py',
+    'fix-useeffect-deps.py',
+]
+
+# Shared modules the transforms are built on; part of the cache version
+ENGINE_SOURCES = ['hook_codemod.py', 'hook_scanner.py']
+
+# Upper bound on files per work unit sent to a worker process
+MAX_CHUNK_SIZE = 64
+
+Transform = Callable[[str], Tuple[str, int]]
+# (size, mtime_ns, sha256) of a file that came out of the pipeline unchanged
+Stamp = Tuple[int, int, str]
+# (path, sha256 recorded in the cache, if any)
+WorkItem = Tuple[str, Optional[str]]
+# (path, fixes, error, stamp)
+FileResult = Tuple[str, int, Optional[str], Optional[Stamp]]
+
+_loaded_plugins: Dict[str, List[Transform]] = {}
+
+
+def load_transforms(plugin: str) -> List[Transform]:
+    """Load the TRANSFORMS list exported by a plugin script"""
+    if plugin not in _loaded_plugins:
+        path = SCRIPTS_DIR / plugin
+        module_name = 'hook_codemod_' + path.stem.replace('-', '_')
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_plugins[plugin] = list(module.TRANSFORMS)
+    return _loaded_plugins[plugin]
+
+
+def build_pipeline(plugins: Sequence[str]) -> List[Transform]:
+    """Concatenate the transforms of every plugin, in order"""
+    pipeline = []
+    for plugin in plugins:
+        pipeline.extend(load_transforms(plugin))
+    return pipeline
+
+
+def apply_transforms(content: str, transforms: Sequence[Transform]) -> Tuple[str, int]:
+    """Run each transform over the content, returning the result and total fixes"""
+    total = 0
+    for transform in transforms:
+        content, fixes = transform(content)
+        total += fixes
+    return content, total
+
+
+def transform_version(plugins: Sequence[str]) -> str:
+    """Hash of the engine and plugin sources; changes whenever a transform changes"""
+    digest = hashlib.sha256()
+    for path in [SCRIPTS_DIR / p for p in ENGINE_SOURCES + list(plugins)]:
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class CodemodCache:
+    """Persistent record of files known to produce zero fixes for a transform set"""
+
+    def __init__(self, plugins: Sequence[str]):
+        pipeline_id = hashlib.sha1('|'.join(plugins).encode('utf-8')).hexdigest()[:12]
+        self.path = CACHE_DIR / f"{pipeline_id}.json"
+        self.version = transform_version(plugins)
+        self.files: Dict[str, Stamp] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == self.version:
+                self.files = {k: tuple(v) for k, v in data.get('files', {}).items()}
+        except (OSError, ValueError):
+            pass
+
+    def is_fresh(self, path: str, stat: os.stat_result) -> bool:
+        """True when size and mtime still match a file recorded as clean"""
+        stamp = self.files.get(path)
+        return stamp is not None and stamp[0] == stat.st_size and stamp[1] == stat.st_mtime_ns
+
+    def digest(self, path: str) -> Optional[str]:
+        stamp = self.files.get(path)
+        return stamp[2] if stamp else None
+
+    def update(self, path: str, stamp: Optional[Stamp]):
+        if stamp is None:
+            self.files.pop(path, None)
+        else:
+            self.files[path] = stamp
+
+    def save(self, seen: Set[str]):
+        """Write the cache, dropping entries for files no longer in the tree"""
+        files = {k: list(v) for k, v in self.files.items() if k in seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({'version': self.version, 'files': files}), encoding='utf-8')
+
+
+def transform_file(file_path: Path, transforms: Sequence[Transform],
+                   known_digest: Optional[str] = None) -> Tuple[int, Optional[Stamp]]:
+    """
+    Apply the pipeline to a single file, writing it back only if it changed.
+    Returns the fixes made and, if the file was left untouched, its cache stamp.
+    """
+    with open(file_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    stamp = (stat.st_size, stat.st_mtime_ns, digest)
+
+    # Content unchanged since it last came out clean (e.g. only touched)
+    if digest == known_digest:
+        return 0, stamp
+
+    original = data.decode('utf-8')
+    content, total = apply_transforms(original, transforms)
+
+    if content != original:
+        file_path.write_text(content, encoding='utf-8')
+        return total, None
+    return 0, stamp
+
+
+def _fix_chunk(plugins: Sequence[str], work: Sequence[WorkItem]) -> List[FileResult]:
+    """Worker entry point: fix a chunk of files and report per-file results"""
+    transforms = build_pipeline(plugins)
+    results = []
+    for path, known_digest in work:
+        try:
+            fixes, stamp = transform_file(Path(path), transforms, known_digest)
+            results.append((path, fixes, None, stamp))
+        except Exception as e:
+            results.append((path, 0, str(e), None))
+    return results
+
+
+def _chunked(items: Sequence[WorkItem], size: int) -> Iterator[List[WorkItem]]:
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def iter_results(plugins: Sequence[str], work: Sequence[WorkItem], jobs: int = 1) -> Iterator[FileResult]:
+    """Yield (path, fixes, error, stamp) per file, serially or across a process pool"""
+    if jobs <= 1 or len(work) <= 1:
+        yield from _fix_chunk(plugins, work)
+        return
+
+    # Several chunks per worker keeps the pool balanced when file sizes vary
+    chunk_size = max(1, min(MAX_CHUNK_SIZE, -(-len(work) // (jobs * 4))))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunks = _chunked(work, chunk_size)
+        for results in executor.map(_fix_chunk, repeat(plugins), chunks):
+            yield from results
+
+
+def run(plugins: Sequence[str], title: str, root: Path = WEB_APP_DIR, jobs: int = 1,
+        use_cache: bool = True) -> Tuple[int, int]:
+    """Walk the tree once and run the plugins' transforms over every TSX file"""
+    # Load plugins up front so a broken plugin fails before any file is touched
+    build_pipeline(plugins)
+    cache = CodemodCache(plugins) if use_cache else None
+
+    print(title)
+    print("=" * 50)
+
+    files = [str(tsx) for tsx in root.rglob("*.tsx")]
+    work = []
+    skipped = 0
+    for path in files:
+        if cache is None:
+            work.append((path, None))
+        elif cache.is_fresh(path, os.stat(path)):
+            skipped += 1
+        else:
+            work.append((path, cache.digest(path)))
+
+    total = 0
+    fixed_files = 0
+
+    for path, fixed, error, stamp in iter_results(plugins, work, jobs):
+        if cache is not None:
+            cache.update(path, stamp)
+        if error is not None:
+            print(f"❌ {path}: {error}")
+        elif fixed > 0:
+            print(f"✅ {Path(path).name}: {fixed} fixes")
+            fixed_files += 1
+            total += fixed
+
+    if cache is not None:
+        cache.save(set(files))
+        print(f"\n⚡ Skipped {skipped} unchanged files (cache: {cache.path})")
+
+    print(f"\n🎉 Fixed {total} warnings in {fixed_files} files")
+    return total, fixed_files
+
+
+def parse_args(argv: Sequence[str] = None, description: str = None,
+               with_plugins: bool = True) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    if with_plugins:
+        parser.add_argument('plugins', nargs='*', default=PLUGINS,
+                            help='plugin scripts to run (default: all)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='worker processes; 0 uses every CPU (default: 1)')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help='ignore and do not update the incremental cache')
+    args = parser.parse_args(argv)
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
+
+def main(argv: Sequence[str] = None, plugins: Sequence[str] = None,
+         title: str = "🔧 Running React Hook Codemods"):
+    """CLI entry point, shared by the engine and the individual plugin scripts"""
+    args = parse_args(argv, description=title, with_plugins=plugins is None)
+    plugins = list(plugins if plugins is not None else args.plugins)
+    unknown = [p for p in plugins if not (SCRIPTS_DIR / p).is_file()]
+    if unknown:
+        print(f"❌ Unknown plugin(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    run(plugins, title, jobs=args.jobs, use_cache=args.use_cache)
+
+
+if __name__ == "__main__":
+    main()
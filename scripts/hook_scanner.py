@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Linear-time scanner for React Hook call sites in TS/TSX source.
+
+Tokenizes the file once, skipping strings, comments, template literals and
+regex literals, and tracks bracket nesting so hook bodies and dependency
+arrays are found by structure rather than by backtracking regexes. Each
+call site is reported with its hook name, callback body span and deps-array
+span, all as offsets into the original text.
+
+Usage:
+    python3 scripts/hook_scanner.py path/to/Component.tsx
+"""
+import re
+import string
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+Span = Tuple[int, int]
+
+# Hooks whose second argument is a dependency array
+HOOK_NAMES = frozenset({
+    'useEffect', 'useLayoutEffect', 'useInsertionEffect', 'useCallback', 'useMemo',
+})
+
+# Code inside brackets that needs no tokens: no brackets, literals or slashes
+_PLAIN = r"""[^'"`/()\[\]{}]"""
+
+# Bracket groups nested this deep around plain code are skipped as one token
+_GROUP_DEPTH = 4
+
+
+def _nested_pattern(depth: int) -> str:
+    """Plain code with balanced brackets nested at most `depth` deep"""
+    inner = _PLAIN + '*'
+    for _ in range(depth):
+        # Unrolled loop: plain runs and groups start differently, so a failed
+        # match backtracks linearly
+        inner = r'%s*(?:(?:%s)%s*)*' % (_PLAIN, _bracketed(inner), _PLAIN)
+    return inner
+
+
+def _bracketed(inner: str) -> str:
+    """A (), [] or {} pair around `inner`"""
+    return r'\(%s\)|\[%s\]|\{%s\}' % (inner, inner, inner)
+
+
+# One structural token, preceded by the run of plain code (identifiers,
+# operators) before it; `run` excludes leading whitespace and is empty if blank
+_CODE_TOKEN = re.compile(r"""
+    \s*(?P<run>(?:[^\s'"`/()\[\]{},][^'"`/()\[\]{},]*)?)
+    (?:
+      (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+    | (?P<string>'(?:[^'\\\n]|\\[\s\S])*'?|"(?:[^"\\\n]|\\[\s\S])*"?)
+    | (?P<template>`)
+    | (?P<group>%s)
+    | (?P<open>[(\[{])
+    | (?P<close>[)\]}])
+    | (?P<comma>,)
+    | (?P<slash>/)
+    | \Z
+    )
+""" % _bracketed(_nested_pattern(_GROUP_DEPTH - 1)), re.VERBOSE)
+
+# The common `hook(() => { ... }, [deps])` call around plain code, matched whole
+# from its opening paren
+_SIMPLE_HOOK_CALL = re.compile(r"""
+    \(\s*
+    (?P<callback>
+        (?:async\s+)?(?:\(%(plain)s*\)|[\w$]+)\s*=>\s*
+        \{(?P<body>%(body)s)\}
+    )
+    \s*,\s*
+    \[(?P<deps>%(plain)s*)\]
+    \s*\)
+""" % {'plain': _PLAIN, 'body': _nested_pattern(_GROUP_DEPTH - 1)}, re.VERBOSE)
+
+# Template literal text up to the closing backtick or the next ${
+_TEMPLATE_CHUNK = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+
+# Regex literal body; stops at a newline so a misread slash cannot run away
+_REGEX_LITERAL = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\]?)*/?[A-Za-z]*")
+
+# A slash after these starts a regex literal rather than a division
+_REGEX_PREFIX_CHARS = set('(,=:[!&|?{};+-*%~^>')
+_REGEX_PREFIX_WORDS = frozenset({
+    'return', 'typeof', 'case', 'in', 'of', 'delete', 'void', 'throw', 'new',
+    'else', 'do', 'yield', 'await',
+})
+
+_CLOSERS = {')': '(', ']': '[', '}': '{'}
+_WORD_CHARS = string.ascii_letters + string.digits + '_$'
+
+# Bindings introduced inside a hook body; over-matching only makes fixers more cautious
+_DECLARATION = re.compile(r"""
+    \b(?:const|let|var)\s+([\w$]+)
+  | \b(?:const|let|var)\s*([{\[][^=;]*?[}\]])\s*=
+  | \bfunction\b\s*\*?\s*([\w$]*)\s*\(([^)]*)\)
+  | \bcatch\s*\(\s*([\w$]+)
+  | \(([^()]*)\)\s*(?::[^=;{}]*)?=>
+  | ([\w$]+)\s*=>
+""", re.VERBOSE)
+_IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+@dataclass
+class HookCall:
+    """A hook call site; all spans are [start, end) offsets into the source"""
+    name: str
+    start: int
+    end: int = -1
+    args: List[Span] = field(default_factory=list)
+    body: Optional[Span] = None
+    deps: Optional[Span] = None
+
+    @property
+    def callback(self) -> Optional[Span]:
+        """Span of the first argument"""
+        return self.args[0] if self.args else None
+
+
+class _Frame:
+    __slots__ = ('opener', 'start', 'hook', 'arg_start', 'last_block', 'array')
+
+    def __init__(self, opener: str, start: int, hook: Optional[HookCall] = None):
+        self.opener = opener
+        self.start = start
+        self.hook = hook
+        self.arg_start = start + 1
+        self.last_block: Optional[Span] = None
+        self.array: Optional[Span] = None
+
+
+def _close_hook(frame: _Frame, content: str, end: int):
+    """Finalize a hook frame whose closing paren sits at `end`"""
+    hook = frame.hook
+    _end_arg(frame, content, end)
+    hook.end = end + 1
+    callback = hook.callback
+    if callback is not None:
+        # Block body of the callback, else the whole (expression) argument
+        block = frame.last_block
+        if block is not None and callback[0] <= block[0] and block[1] <= callback[1]:
+            hook.body = block
+        else:
+            hook.body = callback
+
+
+def _end_arg(frame: _Frame, content: str, end: int):
+    """Record the argument of a hook frame that ends at `end` (comma or paren)"""
+    hook = frame.hook
+    start, stop = frame.arg_start, end
+    while start < stop and content[start].isspace():
+        start += 1
+    while stop > start and content[stop - 1].isspace():
+        stop -= 1
+    if start < stop:
+        hook.args.append((start, stop))
+        # Second argument made of exactly one array literal is the deps array
+        array = frame.array
+        if len(hook.args) == 2 and array is not None and array[0] - 1 == start and array[1] + 1 == stop:
+            hook.deps = array
+    frame.arg_start = end + 1
+    frame.array = None
+
+
+def scan_hooks(content: str, names: Iterable[str] = HOOK_NAMES,
+               literals: Optional[List[Span]] = None) -> List[HookCall]:
+    """
+    Find every call to one of `names` in a single forward pass.
+    Nested calls are included; results are ordered by start offset.
+    If `literals` is given, the spans of strings, comments, regex literals and
+    template text are appended to it.
+    """
+    names = frozenset(names)
+    hooks: List[HookCall] = []
+    if literals is None and not any(name in content for name in names):
+        return hooks
+    stack: List[_Frame] = []
+    # Last significant token, used to tell regex literals from division and to
+    # spot hook names before `(`. None means "the tail of run_span", which is
+    # only worked out when needed.
+    prev: Optional[str] = ''
+    run_span: Span = (0, 0)
+    suffixes = tuple(names)
+    pos = 0
+    length = len(content)
+    match = _CODE_TOKEN.match
+    skip = _skip_pattern(names)
+    mentions = _name_pattern(names)
+
+    while pos < length:
+        if not stack:
+            # Outside any hook call or template substitution only literals and
+            # hook names matter, so jump straight to the next one of those
+            m = skip.search(content, pos)
+            if m is None:
+                break
+            if m.start() > pos:
+                run_span = (pos, m.start())
+                prev = None
+            name = m.group('hook')
+            if name is None:
+                pos = m.start()
+            else:
+                # The pattern guarantees `(` follows: open the hook frame directly
+                hook = HookCall(name=name, start=m.start())
+                hooks.append(hook)
+                call = _SIMPLE_HOOK_CALL.match(content, m.end())
+                if call is not None and mentions.search(content, m.end(), call.end()) is None:
+                    # Nothing inside needs tokens: take the spans from the match
+                    deps = call.span('deps')
+                    hook.args = [call.span('callback'), (deps[0] - 1, deps[1] + 1)]
+                    hook.body = call.span('body')
+                    hook.deps = deps
+                    hook.end = pos = call.end()
+                    prev = ')'
+                    continue
+                stack.append(_Frame('(', m.end(), hook))
+                pos = m.end() + 1
+                prev = '('
+                continue
+
+        m = match(content, pos)
+        kind = m.lastgroup
+        pos = m.end()
+        # Identifiers and operators since the last structural token
+        run_start, start = m.span('run')
+        if start > run_start:
+            run_span = (run_start, start)
+            prev = None
+        if kind == 'run':
+            # Only plain code was left
+            break
+
+        if kind == 'comment':
+            if literals is not None:
+                literals.append((start, pos))
+            continue
+
+        text = content[start]
+
+        if kind == 'open' or kind == 'group':
+            hook = None
+            if text == '(' and prev is None and content[run_span[0]:run_span[1]].rstrip().endswith(suffixes):
+                token, offset = _last_token(content[run_span[0]:run_span[1]])
+                if token in names:
+                    hook = HookCall(name=token, start=run_span[0] + offset)
+                    hooks.append(hook)
+            if kind == 'group':
+                if hook is None and mentions.search(content, start + 1, pos - 1) is None:
+                    # Brackets around plain code with no hook call inside:
+                    # the whole group in one token
+                    if stack and stack[-1].hook is not None:
+                        if text == '{':
+                            stack[-1].last_block = (start + 1, pos - 1)
+                        elif text == '[':
+                            stack[-1].array = (start + 1, pos - 1)
+                    prev = content[pos - 1]
+                    continue
+                # Hook calls and their arguments are scanned token by token
+                pos = start + 1
+            stack.append(_Frame(text, start, hook))
+            prev = text
+            continue
+
+        if kind == 'close':
+            prev = text
+            if text == '}' and stack and stack[-1].opener == '${':
+                # End of a ${...} substitution: resume the template literal
+                stack.pop()
+                pos = _skip_template(content, pos, stack, literals)
+                prev = 'a'
+                continue
+            # Tolerate stray closers: unwind to the nearest matching opener,
+            # but never out of an enclosing template substitution
+            opener = _CLOSERS[text]
+            depth = len(stack) - 1
+            while depth >= 0 and stack[depth].opener not in (opener, '${'):
+                depth -= 1
+            if depth < 0 or stack[depth].opener != opener:
+                continue
+            frame = stack[depth]
+            del stack[depth:]
+            if frame.hook is not None:
+                _close_hook(frame, content, start)
+            if stack and stack[-1].hook is not None:
+                if opener == '{':
+                    stack[-1].last_block = (frame.start + 1, start)
+                elif opener == '[':
+                    stack[-1].array = (frame.start + 1, start)
+            continue
+
+        if kind == 'comma':
+            if stack and stack[-1].hook is not None:
+                _end_arg(stack[-1], content, start)
+            prev = text
+        elif kind == 'string':
+            if literals is not None:
+                literals.append((start, pos))
+            prev = 'a'
+        elif kind == 'template':
+            pos = _skip_template(content, pos, stack, literals)
+            prev = 'a'
+        else:  # slash
+            if prev is None:
+                prev = _last_token(content[run_span[0]:run_span[1]])[0]
+            if prev == '' or prev in _REGEX_PREFIX_WORDS or prev[-1] in _REGEX_PREFIX_CHARS:
+                pos = _REGEX_LITERAL.match(content, start).end()
+                if literals is not None:
+                    literals.append((start, pos))
+                prev = 'a'
+            else:
+                prev = text
+
+    return hooks
+
+
+def _last_token(text: str) -> Tuple[str, int]:
+    """Trailing word (or single character) of a run of plain code, and its offset in the run"""
+    stripped = text.rstrip()
+    if not stripped:
+        return '', 0
+    head = stripped.rstrip(_WORD_CHARS)
+    if len(head) == len(stripped):
+        return stripped[-1], len(stripped) - 1
+    return stripped[len(head):], len(head)
+
+
+@lru_cache(maxsize=None)
+def _skip_pattern(names: frozenset):
+    """Next literal opener or hook call (`name(`) in code outside any tracked frame"""
+    # Each name's lookbehind follows it, so every branch starts with a literal
+    # character and the regex engine can skip ahead to candidates
+    alternation = '|'.join(r'%s(?<![\w$]%s)' % (re.escape(n), re.escape(n))
+                           for n in sorted(names, key=len, reverse=True))
+    return re.compile(r"""['"`/]|(?P<hook>%s)\s*(?=\()""" % alternation)
+
+
+@lru_cache(maxsize=None)
+def _name_pattern(names: frozenset):
+    """Any occurrence of one of the names (a superset of the calls to them)"""
+    return re.compile('|'.join(re.escape(n) for n in sorted(names, key=len, reverse=True)))
+
+
+def _skip_template(content: str, pos: int, stack: List[_Frame],
+                   literals: Optional[List[Span]] = None) -> int:
+    """Skip template text from `pos`; returns the offset after ` or after ${"""
+    start = pos
+    pos = _TEMPLATE_CHUNK.match(content, pos).end()
+    if literals is not None and pos > start:
+        literals.append((start, pos))
+    if content.startswith('${', pos):
+        stack.append(_Frame('${', pos + 1))
+        return pos + 2
+    return pos + 1
+
+
+def mask_literals(content: str, literals: Iterable[Span]) -> str:
+    """Blank out literal spans so regexes only see code; offsets are preserved"""
+    return replace_spans(content, ((start, end, ' ' * (end - start)) for start, end in literals))
+
+
+@lru_cache(maxsize=4)
+def _scan_code(content: str) -> Tuple[Tuple[HookCall, ...], str]:
+    literals: List[Span] = []
+    hooks = scan_hooks(content, HOOK_NAMES, literals)
+    return tuple(hooks), mask_literals(content, literals)
+
+
+def scan_code(content: str, names: Iterable[str] = HOOK_NAMES) -> Tuple[List[HookCall], str]:
+    """
+    Scan hooks and return them with a copy of the source whose literals are blanked.
+    Results are memoized, so a pipeline of transforms that leave the text
+    unchanged scans each file only once.
+    """
+    hooks, code = _scan_code(content)
+    return [hook for hook in hooks if hook.name in names], code
+
+
+def declared_names(code: str, span: Span) -> Set[str]:
+    """Names declared inside a span (variables, functions, params, catch bindings)"""
+    names: Set[str] = set()
+    for match in _DECLARATION.finditer(code, *span):
+        for group in match.groups():
+            if group:
+                names.update(_IDENTIFIER.findall(group))
+    return names
+
+
+def has_flat_body(content: str, hook: HookCall) -> bool:
+    """
+    True for `hook(... => { ... }, [deps])` with no `}` before the body's closing
+    brace: the only shape the fixers' original `[^}]*` patterns ever matched.
+    """
+    if hook.body is None or hook.deps is None or hook.body == hook.callback:
+        return False
+    close = hook.body[1]
+    return (len(hook.args) == 2 and close + 1 == hook.callback[1]
+            and content.find('}', hook.start, close) < 0)
+
+
+def split_deps(deps_text: str) -> List[str]:
+    """Split the text inside a deps array into its entries"""
+    return [d.strip() for d in deps_text.split(',') if d.strip()]
+
+
+def add_deps(deps_text: str, names: Sequence[str]) -> str:
+    """Append names to the text inside a deps array, keeping its formatting"""
+    if not names:
+        return deps_text
+    added = ', '.join(names)
+    stripped = deps_text.rstrip()
+    if not stripped.strip():
+        return added
+    trailing = deps_text[len(stripped):]
+    if stripped.endswith(','):
+        return f"{stripped} {added}{trailing}"
+    return f"{stripped}, {added}{trailing}"
+
+
+def replace_spans(content: str, edits: Iterable[Tuple[int, int, str]]) -> str:
+    """Apply non-overlapping (start, end, replacement) edits in one pass"""
+    parts = []
+    last = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(content[last:start])
+        parts.append(replacement)
+        last = end
+    parts.append(content[last:])
+    return ''.join(parts)
+
+
+def main():
+    for path in sys.argv[1:]:
+        content = Path(path).read_text(encoding='utf-8')
+        for hook in scan_hooks(content):
+            line = content.count('\n', 0, hook.start) + 1
+            deps = content[hook.deps[0]:hook.deps[1]] if hook.deps else None
+            print(f"{path}:{line}: {hook.name} body={hook.body} deps=[{deps}]")
+
+
+if __name__ == "__main__":
+    main()